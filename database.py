@@ -1,14 +1,29 @@
 """Database connection and session management."""
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from config import settings
+from config import SETTINGS
 
 # Create database engine
+# psycopg2 executemany runs as multi-row VALUES pages (INSERT) and
+# execute_batch pages (UPDATE/DELETE) instead of one round-trip per row
 engine = create_engine(
-    settings.database_url,
+    SETTINGS.database_url,
     pool_pre_ping=True,
-    echo=False
+    echo=False,
+    # Durable commits by default; scraped data can be re-scraped, so
+    # SYNCHRONOUS_COMMIT=off may be set to skip waiting for the WAL flush
+    connect_args={"options": f"-c synchronous_commit={SETTINGS.synchronous_commit}"},
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=1000,
+    executemany_batch_page_size=500,
+    # Room for the prebuilt upsert/lookup statements and ORM queries
+    # without LRU evictions
+    query_cache_size=1200,
+    # JSONB values (hours/amenities/images) are encoded/decoded with orjson
+    json_serializer=lambda value: orjson.dumps(value).decode(),
+    json_deserializer=orjson.loads
 )
 
 # Create session factory
@@ -4,13 +4,18 @@ from loguru import logger
 from database import engine, get_db, Base
 from scrapers.yelp import YelpScraper
 from scrapers.yellowpages import YellowPagesScraper
-from config import settings
+from config import SETTINGS
 
-# Configure logger
+# Configure logger: a single stdout handler (replacing loguru's default
+# stderr one) whose records are formatted and written on a background thread
+logger.remove()
 logger.add(
     sys.stdout,
-    format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
-    level="INFO"
+    format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>",
+    level="INFO",
+    enqueue=True,
+    diagnose=False,
+    backtrace=False
 )
 
 
@@ -33,8 +38,8 @@ def main():
     
     try:
         # Initialize scrapers
-        yelp_scraper = YelpScraper(db, settings.zyte_api_key)
-        yellowpages_scraper = YellowPagesScraper(db, settings.zyte_api_key)
+        yelp_scraper = YelpScraper(db, SETTINGS.zyte_api_key)
+        yellowpages_scraper = YellowPagesScraper(db, SETTINGS.zyte_api_key)
         
         # Example 1: Scrape a single category by title and location
         # businesses = yelp_scraper.scrape_by_category_and_location(
@@ -42,9 +47,7 @@ def main():
         #     location="Montreal",
         #     max_pages=3
         # )
-        # for business_data in businesses:
-        #     if business_data:
-        #         yelp_scraper.save_business(business_data)
+        # yelp_scraper.save_businesses(businesses)
         # yelp_scraper.commit()
         
         # Example 2: Scrape multiple categories at once
@@ -69,11 +72,30 @@ def main():
         # Example 3: Build URL manually and scrape
         # search_url = yelp_scraper.build_search_url("Venues & Events", "Montreal")
         # businesses = yelp_scraper.scrape_businesses_from_search(search_url, max_pages=3)
-        # for business_data in businesses:
-        #     if business_data:
-        #         yelp_scraper.save_business(business_data)
+        # yelp_scraper.save_businesses(businesses)
         # yelp_scraper.commit()
         
+        # Example 4: Scrape many business pages concurrently; the background
+        # writer saves them in batches while fetching continues
+        # from utils.event_loop import run_async
+        # business_urls = yellowpages_scraper.scrape_search_results(
+        #     yellowpages_scraper.build_search_url("Plumbers", "Montreal, QC"),
+        #     max_pages=2
+        # )
+        # run_async(
+        #     yellowpages_scraper.scrape_many(business_urls, max_concurrency=10, save=True)
+        # )
+        # yellowpages_scraper.commit()
+        
+        # Example 5: Scrape several categories concurrently (results are saved)
+        # results = run_async(
+        #     yellowpages_scraper.ascrape_multiple_categories(
+        #         business_titles=["Plumbers", "Electricians", "Dentists"],
+        #         location="Montreal, QC",
+        #         max_pages_per_category=2
+        #     )
+        # )
+        
         logger.info("Scraping completed successfully")
         
     except Exception as e:
@@ -81,6 +103,8 @@ def main():
         raise
     finally:
         db.close()
+        # Wait for queued log records to be written
+        logger.complete()
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 """Database models for business data."""
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, Index, DDL, event
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from database import Base
 
@@ -8,14 +9,26 @@ class Business(Base):
     """Model for storing business information."""
     
     __tablename__ = "businesses"
+    __table_args__ = (
+        # Natural key; INCLUDE makes the duplicate check an index-only scan
+        Index(
+            'uq_businesses_source_source_url', 'source', 'source_url',
+            unique=True, postgresql_include=['id', 'name']
+        ),
+        Index('ix_businesses_amenities_gin', 'amenities', postgresql_using='gin'),
+        # One partition per source (see BUSINESS_PARTITIONS below); the schema
+        # therefore requires PostgreSQL
+        {'postgresql_partition_by': 'LIST (source)'},
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
+    # The partition key must be part of the primary key
+    id = Column(Integer, primary_key=True, autoincrement=True)
     
     # Basic Information
-    name = Column(String(255), nullable=False, index=True)
-    source = Column(String(50), nullable=False, index=True)  # 'yelp' or 'yellowpages'
-    source_url = Column(String(500), unique=True, nullable=False)
-    source_id = Column(String(100), index=True)  # ID from source website
+    name = Column(String(255), nullable=False)
+    source = Column(String(50), primary_key=True, nullable=False)  # 'yelp' or 'yellowpages'
+    source_url = Column(String(500), nullable=False)
+    source_id = Column(String(100))  # ID from source website
     
     # Contact Information
     phone = Column(String(50))
@@ -24,8 +37,8 @@ class Business(Base):
     
     # Location
     address = Column(Text)
-    city = Column(String(100), index=True)
-    state = Column(String(50), index=True)
+    city = Column(String(100))
+    state = Column(String(50))
     zip_code = Column(String(20))
     country = Column(String(100), default="USA")
     latitude = Column(Float)
@@ -37,15 +50,34 @@ class Business(Base):
     rating = Column(Float)
     review_count = Column(Integer)
     
-    # Additional Information (stored as JSON string or separate fields)
-    hours = Column(Text)  # JSON string for business hours
-    amenities = Column(Text)  # JSON string for amenities/features
-    images = Column(Text)  # JSON string for image URLs
+    # Additional Information (JSONB, read back as Python lists/dicts/strings;
+    # None is stored as SQL NULL, not JSON null, so upserts keep stored values)
+    hours = Column(JSONB(none_as_null=True))  # Business hours
+    amenities = Column(JSONB(none_as_null=True))  # List of amenities/features
+    images = Column(JSONB(none_as_null=True))  # List of image URLs
     
     # Metadata
     scraped_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True))  # Set by the scrapers' save methods
+    last_etag = Column(String(255))  # ETag of the source page when last scraped
     is_active = Column(Boolean, default=True)
     
     def __repr__(self):
         return f"<Business(name='{self.name}', source='{self.source}')>"
+
+
+# Partitions of the businesses table: (table name, source value or None for DEFAULT)
+BUSINESS_PARTITIONS = [
+    ("businesses_yelp", "yelp"),
+    ("businesses_yp", "yellowpages"),
+    ("businesses_other", None),
+]
+
+for _partition, _source in BUSINESS_PARTITIONS:
+    _bounds = f"FOR VALUES IN ('{_source}')" if _source else "DEFAULT"
+    event.listen(
+        Business.__table__,
+        "after_create",
+        DDL(f"CREATE TABLE IF NOT EXISTS {_partition} PARTITION OF businesses {_bounds}")
+        .execute_if(dialect="postgresql")
+    )
@@ -1,15 +1,136 @@
 """Base scraper class with common functionality."""
-from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+import csv
+import io
+import threading
+from typing import ContextManager, Dict, Iterable, Iterator, List, Optional, Tuple
 from loguru import logger
+import orjson
+from sqlalchemy import bindparam, func, insert, inspect, select, update
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
 from sqlalchemy.orm import Session
 from models import Business
-from config import settings
+from config import SETTINGS
+from utils.background_writer import BackgroundWriter
 
+# Above this many rows save_businesses streams them with COPY instead
+COPY_THRESHOLD = 5000
 
-class BaseScraper(ABC):
+# Scraped categories are saved together once this many rows are pending
+SAVE_BATCH_SIZE = 10000
+
+# Core INSERT for new businesses; skips ORM instrumentation and identity map
+_BUSINESS_INSERT = insert(Business.__table__)
+
+# Natural key of a business; matches the unique constraint on businesses
+_CONFLICT_KEY = ('source', 'source_url')
+
+# Columns an upsert never overwrites on an existing business
+_PRESERVED_COLUMNS = ('id', 'scraped_at', 'is_active')
+
+# Statements built once at import so SQLAlchemy's compiled cache is reused
+_EXISTING_STMT = select(Business).where(
+    Business.source == bindparam('source'),
+    Business.source_url == bindparam('source_url')
+)
+
+_upsert = pg_insert(Business.__table__)
+_UPSERT_STMT = _upsert.on_conflict_do_update(
+    index_elements=list(_CONFLICT_KEY),
+    set_={
+        column.name: func.coalesce(_upsert.excluded[column.name], column)
+        for column in Business.__table__.columns
+        if column.name not in _CONFLICT_KEY + _PRESERVED_COLUMNS
+    }
+)
+
+
+def _build_copy_row():
+    """
+    Generate a function copying non-null values from a dict onto a Business.
+    
+    The column set is fixed, so the generated body is one straight-line
+    ``get``/``is not None``/assignment per column instead of a loop with
+    hasattr/setattr.
+    
+    Returns:
+        Function ``_copy_row(business, data)``
+    """
+    lines = ["def _copy_row(business, data):", "    get = data.get"]
+    for attr in inspect(Business).column_attrs:
+        lines += [
+            f"    value = get({attr.key!r})",
+            "    if value is not None:",
+            f"        business.{attr.key} = value",
+        ]
+    namespace: Dict = {}
+    exec("\n".join(lines), namespace)
+    return namespace["_copy_row"]
+
+
+_copy_row = _build_copy_row()
+
+
+def _merge_rows(rows: List[Dict]) -> List[Dict]:
+    """
+    Prepare scraped rows for a bulk upsert.
+
+    Drops empty rows and rows without a source or source_url, merges
+    duplicates of the same (source, source_url) (later non-null values win,
+    as with repeated save_business calls) and gives every row the same
+    column keys. Every row is stamped with one updated_at timestamp taken
+    here, so the database receives it as a plain bound value.
+
+    Args:
+        rows: List of business data dictionaries
+
+    Returns:
+        List of dictionaries ready to be used as INSERT values
+    """
+    columns = Business.__table__.columns.keys()
+    merged: Dict[tuple, Dict] = {}
+    present = set()
+    for row in rows:
+        if not row or not row.get('source') or not row.get('source_url'):
+            continue
+        values = {k: v for k, v in row.items() if k in columns}
+        present.update(values)
+        key = (values['source'], values['source_url'])
+        existing = merged.get(key)
+        if existing is None:
+            merged[key] = values
+        else:
+            existing.update({k: v for k, v in values.items() if v is not None})
+    keys = [key for key in columns if key in present]
+    updated_at = datetime.now(timezone.utc)
+    return [
+        {key: row.get(key) for key in keys} | {'updated_at': updated_at}
+        for row in merged.values()
+    ]
+
+
+class BaseScraper:
     """Base class for all scrapers."""
     
+    __slots__ = (
+        'db', 'zyte_api_key', 'scraping_delay', 'max_retries', 'http_cache_path',
+        'http_cache_ttl', 'source', '_db_lock', '_writer',
+    )
+    
+    # Methods every scraper subclass must override
+    _REQUIRED_METHODS = ('scrape_business', 'scrape_search_results')
+    
+    def __init_subclass__(cls, **kwargs):
+        """Reject subclasses that do not implement the required methods."""
+        super().__init_subclass__(**kwargs)
+        missing = [
+            name for name in BaseScraper._REQUIRED_METHODS
+            if getattr(cls, name) is getattr(BaseScraper, name)
+        ]
+        if missing:
+            raise TypeError(f"{cls.__name__} must implement: {', '.join(missing)}")
+    
     def __init__(self, db_session: Session, zyte_api_key: Optional[str] = None):
         """
         Initialize the scraper.
@@ -19,11 +140,16 @@ class BaseScraper(ABC):
             zyte_api_key: Zyte API key for web scraping
         """
         self.db = db_session
-        self.zyte_api_key = zyte_api_key or settings.zyte_api_key
-        self.scraping_delay = settings.scraping_delay
-        self.max_retries = settings.max_retries
+        self.zyte_api_key = zyte_api_key or SETTINGS.zyte_api_key
+        self.scraping_delay = SETTINGS.scraping_delay
+        self.max_retries = SETTINGS.max_retries
+        self.http_cache_path = SETTINGS.http_cache_path
+        self.http_cache_ttl = SETTINGS.http_cache_ttl
+        # Writer thread and the lock serializing session use between it and
+        # the caller, both created when the first row is queued
+        self._db_lock: Optional[threading.RLock] = None
+        self._writer: Optional[BackgroundWriter] = None
     
-    @abstractmethod
     def scrape_business(self, url: str) -> Optional[Dict]:
         """
         Scrape a single business page.
@@ -34,9 +160,8 @@ class BaseScraper(ABC):
         Returns:
             Dictionary containing business data or None if failed
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def scrape_search_results(self, search_url: str) -> List[str]:
         """
         Scrape search results to get business URLs.
@@ -47,7 +172,7 @@ class BaseScraper(ABC):
         Returns:
             List of business page URLs
         """
-        pass
+        raise NotImplementedError
     
     def save_business(self, business_data: Dict) -> Optional[Business]:
         """
@@ -57,39 +182,304 @@ class BaseScraper(ABC):
             business_data: Dictionary containing business information
             
         Returns:
-            Business model instance or None if failed
+            Business model instance
+            
+        Errors are raised, leaving rollback to the enclosing transaction
+        (see transactionally).
         """
         try:
-            # Check if business already exists
-            existing = self.db.query(Business).filter_by(
-                source_url=business_data.get('source_url')
-            ).first()
+            # Check if business already exists (filtering on source prunes
+            # the lookup to that source's partition)
+            existing = self.db.execute(_EXISTING_STMT, {
+                'source': business_data.get('source'),
+                'source_url': business_data.get('source_url'),
+            }).scalar_one_or_none()
             
             if existing:
                 # Update existing business
-                for key, value in business_data.items():
-                    if hasattr(existing, key) and value is not None:
-                        setattr(existing, key, value)
-                logger.info(f"Updated business: {existing.name}")
+                _copy_row(existing, business_data)
+                existing.updated_at = datetime.now(timezone.utc)
+                logger.debug("Updated business: {}", existing.name)
                 return existing
             else:
                 # Create new business
                 business = Business(**business_data)
                 self.db.add(business)
-                logger.info(f"Created new business: {business.name}")
+                logger.debug("Created new business: {}", business.name)
                 return business
                 
         except Exception as e:
             logger.error(f"Error saving business: {e}")
-            self.db.rollback()
-            return None
+            raise
+    
+    def save_businesses(self, rows: List[Dict]) -> int:
+        """
+        Save many businesses with bulk INSERT ... ON CONFLICT DO UPDATE.
+        
+        Rows are sent as one executemany of a prebuilt statement, which the
+        engine pages into multi-row VALUES batches. As in save_business, only
+        non-null values overwrite the data of an existing business.
+        
+        Args:
+            rows: List of dictionaries containing business information
+            
+        Returns:
+            Number of businesses saved
+        """
+        if len(rows) > COPY_THRESHOLD:
+            return self.bulk_copy(rows)
+        
+        rows = _merge_rows(rows)
+        if not rows:
+            return 0
+        
+        try:
+            self.db.execute(_UPSERT_STMT, rows)
+            logger.info(f"Saved {len(rows)} businesses")
+            return len(rows)
+            
+        except Exception as e:
+            logger.error(f"Error saving businesses: {e}")
+            raise
+    
+    def save_businesses_batch(self, rows: List[Dict]) -> int:
+        """
+        Save many businesses with one existence query and bulk INSERT/UPDATE.
+        
+        Existing businesses are found with a single SELECT over all
+        source_urls; new ones are inserted and existing ones updated (non-null
+        values only) with one executemany each. Unlike save_businesses this
+        does not rely on PostgreSQL's ON CONFLICT.
+        
+        Args:
+            rows: List of dictionaries containing business information
+            
+        Returns:
+            Number of businesses saved
+        """
+        rows = _merge_rows(rows)
+        if not rows:
+            return 0
+        
+        try:
+            existing_ids = {
+                (source, source_url): business_id
+                for source, source_url, business_id in self.db.execute(
+                    select(Business.source, Business.source_url, Business.id).where(
+                        Business.source_url.in_([row['source_url'] for row in rows])
+                    )
+                )
+            }
+            
+            to_insert = []
+            to_update = []
+            for row in rows:
+                business_id = existing_ids.get((row['source'], row['source_url']))
+                if business_id is None:
+                    to_insert.append(row)
+                else:
+                    values = {k: v for k, v in row.items() if v is not None}
+                    values['id'] = business_id
+                    to_update.append(values)
+            
+            if to_insert:
+                self.db.execute(_BUSINESS_INSERT, to_insert)
+            if to_update:
+                self.db.execute(update(Business), to_update)
+            logger.info(f"Saved {len(rows)} businesses ({len(to_insert)} new, {len(to_update)} updated)")
+            return len(rows)
+            
+        except Exception as e:
+            logger.error(f"Error saving businesses: {e}")
+            raise
+    
+    def bulk_copy(self, rows: List[Dict]) -> int:
+        """
+        Save many businesses by streaming them with PostgreSQL COPY.
+        
+        Rows are copied into a temporary table, then merged into businesses
+        with one INSERT ... SELECT ... ON CONFLICT DO UPDATE, with the same
+        non-null overwrite rule as save_businesses.
+        
+        Args:
+            rows: List of dictionaries containing business information
+            
+        Returns:
+            Number of businesses saved
+        """
+        rows = _merge_rows(rows)
+        if not rows:
+            return 0
+        
+        columns = list(rows[0])
+        column_list = ', '.join(columns)
+        updates = ', '.join(
+            f"{column} = COALESCE(EXCLUDED.{column}, businesses.{column})"
+            for column in columns
+            if column not in _CONFLICT_KEY + _PRESERVED_COLUMNS
+        )
+        
+        # Empty strings are written unquoted, so COPY reads them as NULL;
+        # JSONB values are written as JSON text
+        json_columns = {
+            column for column in columns
+            if isinstance(Business.__table__.c[column].type, JSONB)
+        }
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([
+                orjson.dumps(row[column]).decode()
+                if column in json_columns and row[column] is not None
+                else row[column]
+                for column in columns
+            ])
+        buffer.seek(0)
+        
+        try:
+            cursor = self.db.connection().connection.cursor()
+            try:
+                # Only the copied columns: LIKE would also copy id's NOT NULL
+                # constraint without its serial default
+                cursor.execute(
+                    f"CREATE TEMP TABLE tmp_businesses ON COMMIT DROP AS "
+                    f"SELECT {column_list} FROM businesses WITH NO DATA"
+                )
+                cursor.copy_expert(
+                    f"COPY tmp_businesses ({column_list}) FROM STDIN WITH CSV",
+                    buffer
+                )
+                cursor.execute(
+                    f"INSERT INTO businesses ({column_list}) "
+                    f"SELECT {column_list} FROM tmp_businesses "
+                    f"ON CONFLICT ({', '.join(_CONFLICT_KEY)}) DO UPDATE SET {updates}"
+                )
+                cursor.execute("DROP TABLE tmp_businesses")
+            finally:
+                cursor.close()
+            logger.info(f"Copied {len(rows)} businesses")
+            return len(rows)
+            
+        except Exception as e:
+            logger.error(f"Error copying businesses: {e}")
+            raise
+    
+    def _save_categories(
+        self,
+        categories: Iterable[Tuple[str, List[Dict]]]
+    ) -> Dict[str, List[Dict]]:
+        """
+        Save scraped categories in batches of about SAVE_BATCH_SIZE rows.
+        
+        Categories are consumed as they are produced, so only the pending
+        batch is buffered. Each batch is saved in its own savepoint: if it
+        fails, only its categories are rolled back. Their scraped businesses
+        are still returned, and the categories that could not be saved are
+        logged. Call inside transactionally().
+        
+        Args:
+            categories: (business title, businesses) pairs
+            
+        Returns:
+            Dictionary mapping business titles to lists of business data
+        """
+        results = {}
+        failed = []
+        pending = []
+        pending_rows = 0
+        
+        for business_title, businesses in categories:
+            results[business_title] = businesses
+            pending.append(business_title)
+            pending_rows += len(businesses)
+            if pending_rows >= SAVE_BATCH_SIZE:
+                if not self._save_category_batch(results, pending):
+                    failed.extend(pending)
+                pending = []
+                pending_rows = 0
+        
+        if not self._save_category_batch(results, pending):
+            failed.extend(pending)
+        if failed:
+            logger.error(f"Categories not saved (scraped data is returned): {', '.join(failed)}")
+        return results
+    
+    def _save_category_batch(self, results: Dict[str, List[Dict]], business_titles: List[str]) -> bool:
+        """Save the businesses of several categories in one savepoint; False if it failed."""
+        rows = [row for business_title in business_titles for row in results[business_title]]
+        if not rows:
+            return True
+        
+        try:
+            with self.db.begin_nested():
+                self.save_businesses(rows)
+            return True
+        except Exception as e:
+            logger.error(f"Error saving {', '.join(business_titles)}: {e}")
+            return False
+    
+    def queue_business(self, business_data: Optional[Dict]):
+        """
+        Queue business data to be saved by the background writer thread.
+        
+        Rows are upserted in batches (see save_businesses) while scraping
+        continues; commit() waits for the queue to drain first. Blocks while
+        the queue is full. Do not use the session directly while rows are
+        queued, other than through commit().
+        
+        Args:
+            business_data: Dictionary containing business information
+        """
+        if business_data:
+            if self._writer is None:
+                self._db_lock = threading.RLock()
+                self._writer = BackgroundWriter(self._save_queued)
+            self._writer.put(business_data)
+    
+    def _save_queued(self, rows: List[Dict]) -> int:
+        """
+        Save a batch from the writer queue (runs on the writer thread).
+        
+        Each batch is saved in its own savepoint, so a failed batch doesn't
+        abort the transaction for the batches after it.
+        """
+        with self._db_lock, self.db.begin_nested():
+            return self.save_businesses(rows)
+    
+    def _session_lock(self) -> ContextManager:
+        """Lock shared with the writer thread (a no-op until a row is queued)."""
+        return self._db_lock if self._db_lock is not None else nullcontext()
+    
+    @contextmanager
+    def transactionally(self) -> Iterator[Session]:
+        """
+        Run the enclosed database writes as a single transaction.
+        
+        Commits once when the block exits normally and rolls everything back
+        if it raises. Use ``self.db.begin_nested()`` inside the block to
+        isolate parts that may fail on their own.
+        
+        Yields:
+            Database session
+        """
+        try:
+            yield self.db
+        except Exception:
+            with self._session_lock():
+                self.db.rollback()
+            raise
+        self.commit()
     
     def commit(self):
-        """Commit database changes."""
+        """Commit database changes, after saving any queued businesses."""
         try:
-            self.db.commit()
+            if self._writer is not None:
+                self._writer.flush()
+            with self._session_lock():
+                self.db.commit()
             logger.info("Database changes committed")
         except Exception as e:
             logger.error(f"Error committing to database: {e}")
-            self.db.rollback()
+            with self._session_lock():
+                self.db.rollback()
             raise
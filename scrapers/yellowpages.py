@@ -1,23 +1,320 @@
 """Yellow Pages scraper implementation."""
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
 from loguru import logger
 from sqlalchemy.orm import Session
-from urllib.parse import urljoin, urlparse, parse_qs, urlencode, quote_plus
+from urllib.parse import urljoin, urlparse, parse_qsl, urlencode
+import asyncio
+import os
 import re
-import json
-import time
+import sys
+from bs4 import SoupStrainer
+from lxml import etree
 from scrapers.base import BaseScraper
+from utils.urls import abs_url
 from utils.zyte_client import ZyteClient
 
 
+# Text patterns
+_RE_RATING = re.compile(r'(\d+\.?\d*)\s*(?:star|rating)', re.I)
+_RE_FLOAT = re.compile(r'(\d+\.\d+)')
+_RE_REVIEW = re.compile(r'(\d+)\s*review', re.I)
+# "address, city, state ZIP[, ...]": city and state are optional, and the
+# state is the text of the third part before its first ZIP code
+_RE_ADDRESS = re.compile(
+    r'([^,]*)'
+    r'(?:,([^,]*)'
+    r'(?:,((?:[^,\d]+|(?!\b\d{5}(?:-\d{4})?\b)\d)*)(\d{5}(?:-\d{4}\b)?)?)?)?'
+)
+_RE_PHONE = re.compile(r'[\d\s\-\(\)\.]+')
+_RE_WS = re.compile(r'\s+')
+
+# Attribute patterns of the BeautifulSoup selectors
+_RE_CLS_RESULT = re.compile(r'result', re.I)
+_RE_CLS_LISTING = re.compile(r'listing', re.I)
+_RE_CLS_BUSINESS = re.compile(r'business', re.I)
+_RE_CLS_BUSINESS_NAME = re.compile(r'business-name', re.I)
+_RE_CLS_PHONE = re.compile(r'phone', re.I)
+_RE_CLS_ADDRESS = re.compile(r'address', re.I)
+_RE_CLS_RATING = re.compile(r'rating', re.I)
+_RE_CLS_REVIEW = re.compile(r'review', re.I)
+# Also checked on the raw HTML: a page without "next" anywhere can't match a
+# next-page selector, so their lookups are skipped (a linear scan)
+_RE_NEXT = re.compile(r'next', re.I)
+_RE_HREF_TEL = re.compile(r'tel:', re.I)
+_RE_HREF_CATEGORY = re.compile(r'/search\?search_terms=')
+
+
+@lru_cache(maxsize=512)
+def _search_query(business_title: str, location: str) -> str:
+    """Encoded query of a search URL (categories are searched again and again)."""
+    return urlencode({'search_terms': business_title, 'geo_location_terms': location})
+
+
+def _has(attr: str, word: str) -> str:
+    """XPath test: attribute contains word, ignoring (ASCII) case."""
+    return (
+        f"contains(translate(@{attr}, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', "
+        f"'abcdefghijklmnopqrstuvwxyz'), '{word}')"
+    )
+
+
+# Search results selectors, compiled once. Each tuple is tried in order and
+# the first match wins, as the search page parsing has always done.
+_LISTING_XPATHS = tuple(etree.XPath(f"//{path}") for path in (
+    f"div[{_has('class', 'result')}]",
+    f"div[{_has('class', 'listing')}]",
+    f"div[{_has('class', 'business')}]",
+    "article",
+    f"li[{_has('class', 'result')}]",
+))
+_NEXT_PAGE_XPATHS = tuple(etree.XPath(f"(//a[{test}])[1]") for test in (
+    _has('class', 'next'),
+    _has('aria-label', 'next'),
+    _has('title', 'next'),
+))
+
+# Visible text, skipping script/style contents (as BeautifulSoup's get_text does)
+_TEXT_XPATH = etree.XPath("descendant::text()[not(parent::script) and not(parent::style)]")
+
+
+# Tags looked up on BeautifulSoup-parsed pages. Matching elements are kept
+# with their whole subtree, so lookups give the same results as on a full
+# parse while <head>, scripts and other unrelated markup are skipped.
+_SEARCH_PAGE_STRAINER = SoupStrainer(['div', 'article', 'a'])
+_BUSINESS_PAGE_STRAINER = SoupStrainer(['h1', 'h2', 'div', 'a', 'span', 'img'])
+
+# CSS selectors of business page fields (compiled once by soupsieve and
+# matched without a Python regex call per tag)
+_DESCRIPTION_SELECTOR = 'div[class*="description" i], div[class*="about" i]'
+_HOURS_SELECTOR = 'div[class*="hours" i], div[class*="schedule" i]'
+_IMAGE_SELECTOR = 'img[src*=".jpg" i], img[src*=".jpeg" i], img[src*=".png" i]'
+
+
+def _text(element) -> str:
+    """Stripped text of an element, like BeautifulSoup's get_text(strip=True)."""
+    return ''.join(text.strip() for text in _TEXT_XPATH(element))
+
+
+def _source_id_from_url(url: str) -> Optional[str]:
+    """Business id from a URL like '.../joes-plumbing-123.html' (None if not a .html page)."""
+    name = url.partition('?')[0].partition('#')[0].rpartition('/')[2]
+    return name[:-5] if len(name) > 5 and name.endswith('.html') else None
+
+
+def _is_http_url(href: Optional[str]) -> bool:
+    """Whether an href is an absolute http(s) URL (scheme matched case-insensitively)."""
+    return href is not None and href[:8].lower().startswith(('http://', 'https://'))
+
+
+# Tags that can match a listing selector (filtered in C by lxml)
+_LISTING_TAGS = ('a', 'h2', 'h3', 'span', 'div', 'img')
+
+
+def _scan_listing(listing_element) -> Dict[str, list]:
+    """
+    Find the elements a search result listing is parsed from, in one walk.
+    
+    Each field has an ordered list of selectors (first = preferred). For
+    single-valued fields, found[field][i] is the first element in document
+    order matching the field's i-th selector (None if there is none), which
+    is what trying find() with each selector in turn used to return.
+    found['category'][i] holds every element matching the i-th category
+    selector, in document order.
+    
+    Args:
+        listing_element: Listing element of a page parsed with lxml
+        
+    Returns:
+        Dictionary mapping field names to per-selector matches
+    """
+    found = {
+        # a.business-name, h2, h3, a.listing, span.business-name
+        'name': [None] * 5,
+        # div.phone, span.phone, a[href*=tel:], div[itemprop=telephone]
+        'phone': [None] * 4,
+        # div.address, span.address, div[itemprop=address], div.location
+        'address': [None] * 4,
+        # a[href^=http(s)://]
+        'website': [None],
+        # div.rating, span.rating, div[itemprop=ratingValue]
+        'rating': [None] * 3,
+        # span.review, div.review
+        'review': [None] * 2,
+        # div.category, span.category, a.category
+        'category': ([], [], []),
+        # div.description, div.snippet
+        'description': [None],
+        # img
+        'image': [None],
+    }
+    
+    def match(field: str, index: int, element):
+        if found[field][index] is None:
+            found[field][index] = element
+    
+    for element in listing_element.iterdescendants(*_LISTING_TAGS):
+        tag = element.tag
+        cls = element.get('class', '').lower()
+        if tag == 'div':
+            itemprop = element.get('itemprop')
+            if 'phone' in cls:
+                match('phone', 0, element)
+            if itemprop == 'telephone':
+                match('phone', 3, element)
+            if 'address' in cls:
+                match('address', 0, element)
+            if itemprop == 'address':
+                match('address', 2, element)
+            if 'location' in cls:
+                match('address', 3, element)
+            if 'rating' in cls:
+                match('rating', 0, element)
+            if itemprop == 'ratingValue':
+                match('rating', 2, element)
+            if 'review' in cls:
+                match('review', 1, element)
+            if 'category' in cls:
+                found['category'][0].append(element)
+            if 'description' in cls or 'snippet' in cls:
+                match('description', 0, element)
+        elif tag == 'span':
+            if 'business-name' in cls:
+                match('name', 4, element)
+            if 'phone' in cls:
+                match('phone', 1, element)
+            if 'address' in cls:
+                match('address', 1, element)
+            if 'rating' in cls:
+                match('rating', 1, element)
+            if 'review' in cls:
+                match('review', 0, element)
+            if 'category' in cls:
+                found['category'][1].append(element)
+        elif tag == 'a':
+            href = element.get('href', '').lower()
+            if 'business-name' in cls:
+                match('name', 0, element)
+            if 'listing' in cls:
+                match('name', 3, element)
+            if 'tel:' in href:
+                match('phone', 2, element)
+            if href.startswith(('http://', 'https://')):
+                match('website', 0, element)
+            if 'category' in cls:
+                found['category'][2].append(element)
+        elif tag == 'h2':
+            match('name', 1, element)
+        elif tag == 'h3':
+            match('name', 2, element)
+        else:
+            match('image', 0, element)
+    
+    return found
+
+
 class YellowPagesScraper(BaseScraper):
     """Scraper for Yellow Pages business listings."""
     
-    def __init__(self, db_session: Session, zyte_api_key: Optional[str] = None):
+    __slots__ = ('base_url', 'zyte_client')
+    
+    # Fields of a scraped business, copied for every listing and page
+    _BUSINESS_TEMPLATE = {
+        'name': None,
+        'source': None,
+        'source_url': None,
+        'source_id': None,
+        'phone': None,
+        'email': None,
+        'website': None,
+        'address': None,
+        'city': None,
+        'state': None,
+        'zip_code': None,
+        'country': 'USA',
+        'latitude': None,
+        'longitude': None,
+        'category': None,
+        'description': None,
+        'rating': None,
+        'review_count': None,
+        'hours': None,
+        'amenities': None,
+        'images': None,
+    }
+    
+    # BeautifulSoup selectors, tried in order (first match wins)
+    _LISTING_SELECTORS = (
+        ('div', {'class': _RE_CLS_RESULT}),
+        ('div', {'class': _RE_CLS_LISTING}),
+        ('div', {'class': _RE_CLS_BUSINESS}),
+        ('article', {}),
+    )
+    
+    _LISTING_NAME_SELECTORS = (
+        ('a', {'class': _RE_CLS_BUSINESS_NAME}),
+        ('h2', {}),
+        ('h3', {}),
+        ('a', {'class': _RE_CLS_LISTING}),
+    )
+    
+    _NEXT_PAGE_SELECTORS = (
+        ('a', {'class': _RE_NEXT}),
+        ('a', {'aria-label': _RE_NEXT}),
+    )
+    
+    _NAME_SELECTORS = (
+        ('h1', {}),
+        ('h2', {'class': _RE_CLS_BUSINESS_NAME}),
+        ('div', {'class': _RE_CLS_BUSINESS_NAME}),
+    )
+    
+    _PHONE_SELECTORS = (
+        ('div', {'class': _RE_CLS_PHONE}),
+        ('a', {'href': _RE_HREF_TEL}),
+        ('span', {'itemprop': 'telephone'}),
+    )
+    
+    _ADDRESS_SELECTORS = (
+        ('div', {'class': _RE_CLS_ADDRESS}),
+        ('span', {'itemprop': 'address'}),
+        ('div', {'itemprop': 'address'}),
+    )
+    
+    def __init__(
+        self,
+        db_session: Session,
+        zyte_api_key: Optional[str] = None,
+        request_delay: Optional[float] = None,
+        http_cache: bool = True
+    ):
+        """
+        Initialize the scraper.
+        
+        Args:
+            db_session: Database session
+            zyte_api_key: Zyte API key for web scraping
+            request_delay: Seconds between Zyte requests (None for the
+                scraping_delay setting)
+            http_cache: Cache Zyte responses in the http_cache_path file, if
+                set (worker processes don't: they would contend for the file)
+        """
         super().__init__(db_session, zyte_api_key)
+        if request_delay is not None:
+            self.scraping_delay = request_delay
         self.source = "yellowpages"
         self.base_url = "https://www.yellowpages.com"
-        self.zyte_client = ZyteClient(self.zyte_api_key) if self.zyte_api_key else None
+        self.zyte_client = (
+            ZyteClient(
+                self.zyte_api_key,
+                cache_path=self.http_cache_path if http_cache else None,
+                cache_ttl=self.http_cache_ttl,
+                max_retries=self.max_retries,
+                request_delay=self.scraping_delay
+            )
+            if self.zyte_api_key else None
+        )
     
     def build_search_url(self, business_title: str, location: str) -> str:
         """
@@ -34,12 +331,7 @@ class YellowPagesScraper(BaseScraper):
             >>> scraper.build_search_url("Plumbers", "Montreal, QC")
             'https://www.yellowpages.com/search?search_terms=Plumbers&geo_location_terms=Montreal%2C+QC'
         """
-        params = {
-            'search_terms': business_title,
-            'geo_location_terms': location
-        }
-        query_string = urlencode(params)
-        return f"{self.base_url}/search?{query_string}"
+        return f"{self.base_url}/search?{_search_query(business_title, location)}"
     
     def scrape_by_category_and_location(
         self, 
@@ -67,7 +359,8 @@ class YellowPagesScraper(BaseScraper):
         self,
         business_titles: List[str],
         location: str,
-        max_pages_per_category: Optional[int] = None
+        max_pages_per_category: Optional[int] = None,
+        processes: Optional[int] = None
     ) -> Dict[str, List[Dict]]:
         """
         Scrape multiple business categories in a given location.
@@ -76,12 +369,33 @@ class YellowPagesScraper(BaseScraper):
             business_titles: List of business categories to scrape
             location: Location to search (e.g., "Montreal, QC", "New York, NY")
             max_pages_per_category: Maximum pages to scrape per category (None for all)
+            processes: Scrape categories in parallel in this many worker
+                processes (None scrapes them one after another). Workers
+                only fetch and parse, without the response cache; rows are
+                saved by this process. The request rate of scraping_delay is
+                shared by the workers.
             
         Returns:
             Dictionary mapping business titles to lists of business data
         """
-        results = {}
+        if processes:
+            return self._scrape_categories_in_processes(
+                business_titles, location, max_pages_per_category, processes
+            )
         
+        # Commit all categories in one transaction, saving them in batches
+        with self.transactionally():
+            return self._save_categories(
+                self._iter_categories(business_titles, location, max_pages_per_category)
+            )
+    
+    def _iter_categories(
+        self,
+        business_titles: List[str],
+        location: str,
+        max_pages_per_category: Optional[int]
+    ) -> Iterator[Tuple[str, List[Dict]]]:
+        """Scrape categories one after another, yielding (business title, businesses)."""
         for business_title in business_titles:
             logger.info(f"Processing category: {business_title}")
             try:
@@ -90,33 +404,129 @@ class YellowPagesScraper(BaseScraper):
                     location, 
                     max_pages=max_pages_per_category
                 )
-                results[business_title] = businesses
                 logger.info(f"Found {len(businesses)} businesses for {business_title}")
-                
-                # Save businesses to database
-                for business_data in businesses:
-                    if business_data:
-                        self.save_business(business_data)
-                self.commit()
-                
-                # Delay between categories to avoid rate limiting
-                if business_title != business_titles[-1]:  # Don't delay after last category
-                    time.sleep(self.scraping_delay)
-                    
             except Exception as e:
                 logger.error(f"Error scraping {business_title}: {e}")
-                results[business_title] = []
+                businesses = []
+            
+            yield business_title, businesses
+    
+    def _scrape_categories_in_processes(
+        self,
+        business_titles: List[str],
+        location: str,
+        max_pages_per_category: Optional[int],
+        processes: int
+    ) -> Dict[str, List[Dict]]:
+        """
+        Scrape categories in worker processes and save them in this one.
+        
+        Categories are saved (in batches, see _save_categories) as their
+        workers return, while the other workers keep scraping.
         
-        return results
+        Args:
+            business_titles: List of business categories to scrape
+            location: Location to search
+            max_pages_per_category: Maximum pages to scrape per category (None for all)
+            processes: Number of worker processes
+            
+        Returns:
+            Dictionary mapping business titles to lists of business data
+        """
+        # Each worker rate-limits its own requests: split the request rate
+        # between the workers that run at once
+        request_delay = self.scraping_delay * min(processes, len(business_titles) or 1)
+        
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = {
+                business_title: executor.submit(
+                    _scrape_category,
+                    self.zyte_api_key,
+                    business_title,
+                    location,
+                    max_pages_per_category,
+                    request_delay
+                )
+                for business_title in business_titles
+            }
+            
+            with self.transactionally():
+                return self._save_categories(self._iter_category_results(futures))
+    
+    @staticmethod
+    def _iter_category_results(
+        futures: Dict[str, Future]
+    ) -> Iterator[Tuple[str, List[Dict]]]:
+        """Wait for each category's worker in turn, yielding (business title, businesses)."""
+        for business_title, future in futures.items():
+            logger.info(f"Processing category: {business_title}")
+            try:
+                businesses = future.result()
+                logger.info(f"Found {len(businesses)} businesses for {business_title}")
+            except Exception as e:
+                logger.error(f"Error scraping {business_title}: {e}")
+                businesses = []
+            yield business_title, businesses
+    
+    async def ascrape_multiple_categories(
+        self,
+        business_titles: List[str],
+        location: str,
+        max_pages_per_category: Optional[int] = None,
+        max_concurrency: Optional[int] = None
+    ) -> Dict[str, List[Dict]]:
+        """
+        Scrape multiple business categories concurrently.
+        
+        Each category paginates sequentially, but up to max_concurrency
+        categories are in flight at once. Results are saved once all
+        categories are scraped, in one transaction (batched as in
+        scrape_multiple_categories).
+        
+        Args:
+            business_titles: List of business categories to scrape
+            location: Location to search (e.g., "Montreal, QC", "New York, NY")
+            max_pages_per_category: Maximum pages to scrape per category (None for all)
+            max_concurrency: Maximum categories scraped at once
+                (defaults to min(64, 5 * CPU count))
+            
+        Returns:
+            Dictionary mapping business titles to lists of business data
+        """
+        if not self.zyte_client:
+            logger.error("Zyte API client not initialized")
+            return {business_title: [] for business_title in business_titles}
+        
+        if max_concurrency is None:
+            max_concurrency = min(64, (os.cpu_count() or 1) * 5)
+        semaphore = asyncio.BoundedSemaphore(max_concurrency)
+        
+        async def scrape_category(business_title: str) -> List[Dict]:
+            async with semaphore:
+                logger.info(f"Processing category: {business_title}")
+                businesses = await self.ascrape_businesses_from_search(
+                    self.build_search_url(business_title, location),
+                    max_pages=max_pages_per_category
+                )
+                logger.info(f"Found {len(businesses)} businesses for {business_title}")
+                return businesses
+        
+        async with self.zyte_client:
+            scraped = await asyncio.gather(
+                *(scrape_category(business_title) for business_title in business_titles)
+            )
+        
+        with self.transactionally():
+            return self._save_categories(zip(business_titles, scraped))
     
     def _extract_rating_from_text(self, text: str) -> Optional[float]:
         """Extract rating from text like '4.5 stars' or '4.5'."""
         try:
-            match = re.search(r'(\d+\.?\d*)\s*(?:star|rating)', text, re.IGNORECASE)
+            match = _RE_RATING.search(text)
             if match:
                 return float(match.group(1))
             # Try to find just a number
-            match = re.search(r'(\d+\.\d+)', text)
+            match = _RE_FLOAT.search(text)
             if match:
                 return float(match.group(1))
         except Exception:
@@ -126,7 +536,7 @@ class YellowPagesScraper(BaseScraper):
     def _extract_review_count(self, text: str) -> Optional[int]:
         """Extract review count from text like '(123 reviews)' or '123 reviews'."""
         try:
-            match = re.search(r'(\d+)\s*review', text, re.IGNORECASE)
+            match = _RE_REVIEW.search(text)
             if match:
                 return int(match.group(1))
         except Exception:
@@ -143,212 +553,123 @@ class YellowPagesScraper(BaseScraper):
         Returns:
             Dictionary with address, city, state, zip_code
         """
-        result = {
-            'address': None,
-            'city': None,
-            'state': None,
-            'zip_code': None
-        }
-        
         if not address_text:
-            return result
+            return {'address': None, 'city': None, 'state': None, 'zip_code': None}
         
-        # Try to parse common address formats
         # Format: "123 Main St, City, State ZIP"
-        parts = [p.strip() for p in address_text.split(',')]
-        
-        if len(parts) >= 1:
-            result['address'] = parts[0]
-        
-        if len(parts) >= 2:
-            result['city'] = parts[1]
-        
-        if len(parts) >= 3:
-            # Last part might be "State ZIP" or just "State"
-            state_zip = parts[2].strip()
-            # Try to extract ZIP code
-            zip_match = re.search(r'\b(\d{5}(?:-\d{4})?)\b', state_zip)
-            if zip_match:
-                result['zip_code'] = zip_match.group(1)
-                result['state'] = state_zip[:zip_match.start()].strip()
-            else:
-                result['state'] = state_zip
-        
-        return result
+        address, city, state, zip_code = _RE_ADDRESS.match(address_text).groups()
+        # Cities and states repeat across listings: intern them so the
+        # records held until they are saved share one copy of each
+        return {
+            'address': address.strip(),
+            'city': sys.intern(city.strip()) if city is not None else None,
+            'state': sys.intern(state.strip()) if state is not None else None,
+            'zip_code': zip_code
+        }
     
     def _parse_business_from_listing(self, listing_element) -> Optional[Dict]:
         """Parse business data from a search result listing element."""
         try:
-            business_data = {
-                'name': None,
-                'source': self.source,
-                'source_url': None,
-                'source_id': None,
-                'phone': None,
-                'email': None,
-                'website': None,
-                'address': None,
-                'city': None,
-                'state': None,
-                'zip_code': None,
-                'country': 'USA',
-                'latitude': None,
-                'longitude': None,
-                'category': None,
-                'description': None,
-                'rating': None,
-                'review_count': None,
-                'hours': None,
-                'amenities': None,
-                'images': None,
-            }
+            business_data = self._BUSINESS_TEMPLATE.copy()
+            business_data['source'] = self.source
+            
+            found = _scan_listing(listing_element)
             
             # Extract business name and URL
-            # Yellow Pages typically uses various selectors for business name
-            name_selectors = [
-                ('a', {'class': re.compile(r'business-name', re.I)}),
-                ('h2', {}),
-                ('h3', {}),
-                ('a', {'class': re.compile(r'listing', re.I)}),
-                ('span', {'class': re.compile(r'business-name', re.I)}),
-            ]
-            
-            name_link = None
-            for tag, attrs in name_selectors:
-                name_link = listing_element.find(tag, attrs)
-                if name_link:
-                    break
+            name_link = next((elem for elem in found['name'] if elem is not None), None)
             
-            if name_link:
+            if name_link is not None:
                 # Get name
-                business_data['name'] = name_link.get_text(strip=True)
+                business_data['name'] = _text(name_link)
                 
                 # Get URL
-                if name_link.name == 'a':
+                if name_link.tag == 'a':
                     href = name_link.get('href', '')
                 else:
                     # If not a link, look for parent link
-                    parent_link = name_link.find_parent('a')
-                    href = parent_link.get('href', '') if parent_link else ''
+                    parent_link = next(name_link.iterancestors('a'), None)
+                    href = parent_link.get('href', '') if parent_link is not None else ''
                 
                 if href:
                     if href.startswith('/'):
-                        business_data['source_url'] = urljoin(self.base_url, href.split('?')[0])
+                        business_data['source_url'] = abs_url(self.base_url, href.split('?')[0])
                     elif href.startswith('http'):
                         business_data['source_url'] = href.split('?')[0]
                     else:
                         business_data['source_url'] = urljoin(self.base_url, href.split('?')[0])
                     
                     # Extract source_id from URL
-                    match = re.search(r'/([^/]+)\.html', business_data['source_url'])
-                    if match:
-                        business_data['source_id'] = match.group(1)
+                    business_data['source_id'] = _source_id_from_url(business_data['source_url'])
             
             # Extract phone number
-            phone_selectors = [
-                ('div', {'class': re.compile(r'phone', re.I)}),
-                ('span', {'class': re.compile(r'phone', re.I)}),
-                ('a', {'href': re.compile(r'tel:', re.I)}),
-                ('div', {'itemprop': 'telephone'}),
-            ]
-            
-            for tag, attrs in phone_selectors:
-                phone_elem = listing_element.find(tag, attrs)
-                if phone_elem:
-                    phone_text = phone_elem.get_text(strip=True)
+            for phone_elem in found['phone']:
+                if phone_elem is not None:
+                    phone_text = _text(phone_elem)
                     # Extract phone number pattern
-                    phone_match = re.search(r'[\d\s\-\(\)\.]+', phone_text)
+                    phone_match = _RE_PHONE.search(phone_text)
                     if phone_match:
-                        business_data['phone'] = re.sub(r'\s+', ' ', phone_match.group(0)).strip()
+                        business_data['phone'] = _RE_WS.sub(' ', phone_match.group(0)).strip()
                         break
             
             # Extract address
-            address_selectors = [
-                ('div', {'class': re.compile(r'address', re.I)}),
-                ('span', {'class': re.compile(r'address', re.I)}),
-                ('div', {'itemprop': 'address'}),
-                ('div', {'class': re.compile(r'location', re.I)}),
-            ]
-            
-            for tag, attrs in address_selectors:
-                address_elem = listing_element.find(tag, attrs)
-                if address_elem:
-                    address_text = address_elem.get_text(strip=True)
+            for address_elem in found['address']:
+                if address_elem is not None:
+                    address_text = _text(address_elem)
                     if address_text:
                         address_parts = self._parse_address(address_text)
                         business_data.update(address_parts)
                         break
             
             # Extract website
-            website_elem = listing_element.find('a', href=re.compile(r'^https?://', re.I))
-            if website_elem:
+            website_elem = found['website'][0]
+            if website_elem is not None:
                 href = website_elem.get('href', '')
                 # Exclude Yellow Pages internal links
                 if 'yellowpages.com' not in href.lower():
                     business_data['website'] = href
             
             # Extract rating
-            rating_selectors = [
-                ('div', {'class': re.compile(r'rating', re.I)}),
-                ('span', {'class': re.compile(r'rating', re.I)}),
-                ('div', {'itemprop': 'ratingValue'}),
-            ]
-            
-            for tag, attrs in rating_selectors:
-                rating_elem = listing_element.find(tag, attrs)
-                if rating_elem:
-                    rating_text = rating_elem.get_text(strip=True)
+            for rating_elem in found['rating']:
+                if rating_elem is not None:
+                    rating_text = _text(rating_elem)
                     business_data['rating'] = self._extract_rating_from_text(rating_text)
                     if business_data['rating']:
                         break
             
             # Extract review count
-            review_selectors = [
-                ('span', {'class': re.compile(r'review', re.I)}),
-                ('div', {'class': re.compile(r'review', re.I)}),
-            ]
-            
-            for tag, attrs in review_selectors:
-                review_elem = listing_element.find(tag, attrs)
-                if review_elem:
-                    review_text = review_elem.get_text(strip=True)
+            for review_elem in found['review']:
+                if review_elem is not None:
+                    review_text = _text(review_elem)
                     business_data['review_count'] = self._extract_review_count(review_text)
                     if business_data['review_count']:
                         break
             
             # Extract categories
-            category_selectors = [
-                ('div', {'class': re.compile(r'category', re.I)}),
-                ('span', {'class': re.compile(r'category', re.I)}),
-                ('a', {'class': re.compile(r'category', re.I)}),
-            ]
-            
             categories = []
-            for tag, attrs in category_selectors:
-                category_elems = listing_element.find_all(tag, attrs)
+            for category_elems in found['category']:
                 for elem in category_elems:
-                    cat_text = elem.get_text(strip=True)
+                    cat_text = _text(elem)
                     if cat_text and cat_text not in categories:
                         categories.append(cat_text)
             
             if categories:
-                business_data['category'] = ', '.join(categories[:5])  # Limit to 5 categories
+                business_data['category'] = sys.intern(', '.join(categories[:5]))  # Limit to 5 categories
             
             # Extract description
-            desc_elem = listing_element.find('div', class_=re.compile(r'description|snippet', re.I))
-            if desc_elem:
-                business_data['description'] = desc_elem.get_text(strip=True)
+            desc_elem = found['description'][0]
+            if desc_elem is not None:
+                business_data['description'] = _text(desc_elem)
             
             # Extract image
-            img_elem = listing_element.find('img')
-            if img_elem:
+            img_elem = found['image'][0]
+            if img_elem is not None:
                 img_url = img_elem.get('src', '') or img_elem.get('data-src', '')
                 if img_url:
                     if img_url.startswith('//'):
                         img_url = 'https:' + img_url
                     elif img_url.startswith('/'):
-                        img_url = urljoin(self.base_url, img_url)
-                    business_data['images'] = json.dumps([img_url])
+                        img_url = abs_url(self.base_url, img_url)
+                    business_data['images'] = [img_url]
             
             return business_data if business_data['name'] and business_data['source_url'] else None
             
@@ -356,6 +677,83 @@ class YellowPagesScraper(BaseScraper):
             logger.error(f"Error parsing business listing: {e}")
             return None
     
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _page_url_prefix(search_url: str) -> str:
+        """
+        Build the URL of a search results page, up to its page parameter's value.
+        
+        The URL is parsed and its query encoded once per search; the URL of
+        a page is then the prefix followed by its page number.
+        
+        Args:
+            search_url: URL of the first page
+            
+        Returns:
+            URL ending in 'page=', with properly encoded query parameters
+        """
+        parsed_url = urlparse(search_url)
+        query_params = dict(parse_qsl(parsed_url.query))
+        query_params.pop('page', None)
+        query = urlencode({**query_params, 'page': ''})
+        return parsed_url._replace(query=query, fragment='').geturl()
+    
+    def _parse_search_page(
+        self,
+        document,
+        page: int,
+        html: Optional[str] = None
+    ) -> Tuple[List[Dict], bool]:
+        """
+        Parse the business listings of one page of search results.
+        
+        Args:
+            document: Search results page parsed with ZyteClient.parse_html_lxml
+            page: Page number (for logging)
+            html: Raw HTML of the page, if available; used to skip the
+                next-page lookups when no link can match them
+            
+        Returns:
+            Tuple of (businesses found on the page, whether to fetch the next page)
+        """
+        # Find business listings - Yellow Pages uses various structures
+        listings = []
+        for xpath in _LISTING_XPATHS:
+            listings = xpath(document)
+            if listings:
+                logger.debug(f"Found {len(listings)} listings using selector: {xpath.path}")
+                break
+        
+        if not listings:
+            logger.warning(f"No business listings found on page {page}")
+            return [], False
+        
+        page_businesses = [
+            business_data
+            for business_data in map(self._parse_business_from_listing, listings)
+            if business_data
+        ]
+        
+        logger.info(f"Found {len(page_businesses)} businesses on page {page}")
+        
+        if not page_businesses:
+            logger.info("No businesses found on this page, stopping")
+            return page_businesses, False
+        
+        # Check for next page
+        has_next_page = False
+        if html is None or _RE_NEXT.search(html):
+            for xpath in _NEXT_PAGE_XPATHS:
+                found = xpath(document)
+                if found and found[0].get('href'):
+                    has_next_page = True
+                    break
+        
+        if not has_next_page:
+            logger.info("No next page found")
+        
+        return page_businesses, has_next_page
+    
     def scrape_businesses_from_search(self, search_url: str, max_pages: Optional[int] = None) -> List[Dict]:
         """
         Scrape businesses directly from search results.
@@ -367,22 +765,41 @@ class YellowPagesScraper(BaseScraper):
         Returns:
             List of business data dictionaries
         """
+        return list(self.iter_businesses_from_search(search_url, max_pages=max_pages))
+    
+    def iter_businesses_from_search(
+        self,
+        search_url: str,
+        max_pages: Optional[int] = None
+    ) -> Iterator[Dict]:
+        """
+        Scrape businesses directly from search results, one page at a time.
+        
+        Only the current page is held in memory, so large searches can be
+        saved while they are scraped, e.g.::
+        
+            for business_data in scraper.iter_businesses_from_search(url):
+                scraper.queue_business(business_data)
+            scraper.commit()
+        
+        Args:
+            search_url: URL of the Yellow Pages search results page
+            max_pages: Maximum number of pages to scrape (None for all)
+            
+        Yields:
+            Business data dictionaries
+        """
         logger.info(f"Scraping businesses from Yellow Pages search results: {search_url}")
         
-        businesses = []
+        total = 0
         page = 1
+        page_url_prefix = self._page_url_prefix(search_url)
         
         try:
             while True:
-                # Build URL with pagination
-                if page > 1:
-                    parsed_url = urlparse(search_url)
-                    query_params = parse_qs(parsed_url.query)
-                    query_params['page'] = [str(page)]
-                    new_query = '&'.join([f"{k}={v[0]}" for k, v in query_params.items()])
-                    current_url = f"{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}?{new_query}"
-                else:
-                    current_url = search_url
+                current_url = (
+                    f"{page_url_prefix}{page}" if page > 1 else search_url
+                )
                 
                 logger.info(f"Fetching page {page}: {current_url}")
                 
@@ -397,63 +814,80 @@ class YellowPagesScraper(BaseScraper):
                     break
                 
                 html = response['browserHtml']
-                soup = self.zyte_client.parse_html(html)
-                if not soup:
+                document = self.zyte_client.parse_html_lxml(html)
+                if document is None:
                     logger.warning(f"Failed to parse HTML for page {page}")
                     break
                 
-                # Find business listings - Yellow Pages uses various structures
-                listings = []
-                
-                # Try multiple selectors for business listings
-                listing_selectors = [
-                    ('div', {'class': re.compile(r'result', re.I)}),
-                    ('div', {'class': re.compile(r'listing', re.I)}),
-                    ('div', {'class': re.compile(r'business', re.I)}),
-                    ('article', {}),
-                    ('li', {'class': re.compile(r'result', re.I)}),
-                ]
+                page_businesses, has_next_page = self._parse_search_page(document, page, html)
+                total += len(page_businesses)
+                yield from page_businesses
+                if not has_next_page:
+                    break
                 
-                for tag, attrs in listing_selectors:
-                    found_listings = soup.find_all(tag, attrs)
-                    if found_listings:
-                        listings = found_listings
-                        logger.debug(f"Found {len(listings)} listings using selector: {tag} {attrs}")
-                        break
+                page += 1
                 
-                if not listings:
-                    logger.warning(f"No business listings found on page {page}")
+                if max_pages and page > max_pages:
+                    logger.info(f"Reached max pages limit: {max_pages}")
                     break
+            
+            logger.info(f"Total businesses scraped: {total}")
+            
+        except Exception as e:
+            logger.error(f"Error scraping businesses from search results {search_url}: {e}")
+    
+    async def ascrape_businesses_from_search(
+        self,
+        search_url: str,
+        max_pages: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Async version of scrape_businesses_from_search.
+        
+        Args:
+            search_url: URL of the Yellow Pages search results page
+            max_pages: Maximum number of pages to scrape (None for all)
+            
+        Returns:
+            List of business data dictionaries
+        """
+        if not self.zyte_client:
+            logger.error("Zyte API client not initialized")
+            return []
+        
+        async with self.zyte_client:
+            return await self._ascrape_search(search_url, max_pages)
+    
+    async def _ascrape_search(self, search_url: str, max_pages: Optional[int]) -> List[Dict]:
+        """Scrape search results page by page (inside ``async with self.zyte_client:``)."""
+        logger.info(f"Scraping businesses from Yellow Pages search results: {search_url}")
+        
+        businesses = []
+        page = 1
+        page_url_prefix = self._page_url_prefix(search_url)
+        
+        try:
+            while True:
+                current_url = (
+                    f"{page_url_prefix}{page}" if page > 1 else search_url
+                )
                 
-                page_businesses = []
-                for listing in listings:
-                    business_data = self._parse_business_from_listing(listing)
-                    if business_data:
-                        page_businesses.append(business_data)
-                        businesses.append(business_data)
-                
-                logger.info(f"Found {len(page_businesses)} businesses on page {page}")
+                logger.info(f"Fetching page {page}: {current_url}")
                 
-                if not page_businesses:
-                    logger.info("No businesses found on this page, stopping")
+                response = await self.zyte_client.fetch_page_async(current_url)
+                if not response or 'browserHtml' not in response:
+                    logger.warning(f"No response for page {page}")
                     break
                 
-                # Check for next page
-                next_page_selectors = [
-                    ('a', {'class': re.compile(r'next', re.I)}),
-                    ('a', {'aria-label': re.compile(r'next', re.I)}),
-                    ('a', {'title': re.compile(r'next', re.I)}),
-                ]
-                
-                has_next_page = False
-                for tag, attrs in next_page_selectors:
-                    next_link = soup.find(tag, attrs)
-                    if next_link and next_link.get('href'):
-                        has_next_page = True
-                        break
+                html = response['browserHtml']
+                document = self.zyte_client.parse_html_lxml(html)
+                if document is None:
+                    logger.warning(f"Failed to parse HTML for page {page}")
+                    break
                 
+                page_businesses, has_next_page = self._parse_search_page(document, page, html)
+                businesses.extend(page_businesses)
                 if not has_next_page:
-                    logger.info("No next page found")
                     break
                 
                 page += 1
@@ -461,9 +895,6 @@ class YellowPagesScraper(BaseScraper):
                 if max_pages and page > max_pages:
                     logger.info(f"Reached max pages limit: {max_pages}")
                     break
-                
-                # Delay between requests
-                time.sleep(self.scraping_delay)
             
             logger.info(f"Total businesses scraped: {len(businesses)}")
             return businesses
@@ -486,19 +917,15 @@ class YellowPagesScraper(BaseScraper):
         logger.info(f"Scraping Yellow Pages search results: {search_url}")
         
         business_urls = []
+        seen_urls = set()
         page = 1
+        page_url_prefix = self._page_url_prefix(search_url)
         
         try:
             while True:
-                # Build URL with pagination
-                if page > 1:
-                    parsed_url = urlparse(search_url)
-                    query_params = parse_qs(parsed_url.query)
-                    query_params['page'] = [str(page)]
-                    new_query = '&'.join([f"{k}={v[0]}" for k, v in query_params.items()])
-                    current_url = f"{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}?{new_query}"
-                else:
-                    current_url = search_url
+                current_url = (
+                    f"{page_url_prefix}{page}" if page > 1 else search_url
+                )
                 
                 logger.info(f"Fetching page {page}: {current_url}")
                 
@@ -513,21 +940,14 @@ class YellowPagesScraper(BaseScraper):
                     break
                 
                 html = response['browserHtml']
-                soup = self.zyte_client.parse_html(html)
+                soup = self.zyte_client.parse_html(html, _SEARCH_PAGE_STRAINER)
                 if not soup:
                     logger.warning(f"Failed to parse HTML for page {page}")
                     break
                 
                 # Find business listings
                 listings = []
-                listing_selectors = [
-                    ('div', {'class': re.compile(r'result', re.I)}),
-                    ('div', {'class': re.compile(r'listing', re.I)}),
-                    ('div', {'class': re.compile(r'business', re.I)}),
-                    ('article', {}),
-                ]
-                
-                for tag, attrs in listing_selectors:
+                for tag, attrs in self._LISTING_SELECTORS:
                     found_listings = soup.find_all(tag, attrs)
                     if found_listings:
                         listings = found_listings
@@ -537,18 +957,11 @@ class YellowPagesScraper(BaseScraper):
                     logger.warning(f"No business listings found on page {page}")
                     break
                 
-                page_business_urls = []
+                urls_before_page = len(business_urls)
                 for listing in listings:
                     # Find business name link
-                    name_selectors = [
-                        ('a', {'class': re.compile(r'business-name', re.I)}),
-                        ('h2', {}),
-                        ('h3', {}),
-                        ('a', {'class': re.compile(r'listing', re.I)}),
-                    ]
-                    
                     name_link = None
-                    for tag, attrs in name_selectors:
+                    for tag, attrs in self._LISTING_NAME_SELECTORS:
                         name_link = listing.find(tag, attrs)
                         if name_link:
                             break
@@ -560,36 +973,33 @@ class YellowPagesScraper(BaseScraper):
                             parent_link = name_link.find_parent('a')
                             href = parent_link.get('href', '') if parent_link else ''
                         
-                        if href and '/biz/' in href or '.html' in href:
+                        if href and ('/biz/' in href or '.html' in href):
                             if href.startswith('/'):
-                                full_url = urljoin(self.base_url, href.split('?')[0])
+                                full_url = abs_url(self.base_url, href.split('?')[0])
                             elif href.startswith('http'):
                                 full_url = href.split('?')[0]
                             else:
                                 full_url = urljoin(self.base_url, href.split('?')[0])
                             
-                            if full_url not in business_urls:
+                            if full_url not in seen_urls:
+                                seen_urls.add(full_url)
                                 business_urls.append(full_url)
-                                page_business_urls.append(full_url)
                 
-                logger.info(f"Found {len(page_business_urls)} businesses on page {page}")
+                page_url_count = len(business_urls) - urls_before_page
+                logger.info(f"Found {page_url_count} businesses on page {page}")
                 
-                if not page_business_urls:
+                if not page_url_count:
                     logger.info("No businesses found on this page, stopping")
                     break
                 
                 # Check for next page
-                next_page_selectors = [
-                    ('a', {'class': re.compile(r'next', re.I)}),
-                    ('a', {'aria-label': re.compile(r'next', re.I)}),
-                ]
-                
                 has_next_page = False
-                for tag, attrs in next_page_selectors:
-                    next_link = soup.find(tag, attrs)
-                    if next_link and next_link.get('href'):
-                        has_next_page = True
-                        break
+                if _RE_NEXT.search(html):
+                    for tag, attrs in self._NEXT_PAGE_SELECTORS:
+                        next_link = soup.find(tag, attrs)
+                        if next_link and next_link.get('href'):
+                            has_next_page = True
+                            break
                 
                 if not has_next_page:
                     logger.info("No next page found")
@@ -600,9 +1010,6 @@ class YellowPagesScraper(BaseScraper):
                 if max_pages and page > max_pages:
                     logger.info(f"Reached max pages limit: {max_pages}")
                     break
-                
-                # Delay between requests
-                time.sleep(self.scraping_delay)
             
             logger.info(f"Total business URLs found: {len(business_urls)}")
             return business_urls
@@ -630,143 +1037,208 @@ class YellowPagesScraper(BaseScraper):
             
             # Fetch page using Zyte API
             response = self.zyte_client.fetch_page(url)
-            if not response or 'browserHtml' not in response:
-                logger.error(f"No response for business page: {url}")
-                return None
-            
-            html = response['browserHtml']
-            soup = self.zyte_client.parse_html(html)
-            if not soup:
-                logger.error(f"Failed to parse HTML for business page: {url}")
-                return None
-            
-            business_data = {
-                'name': None,
-                'source': self.source,
-                'source_url': url,
-                'source_id': None,
-                'phone': None,
-                'email': None,
-                'website': None,
-                'address': None,
-                'city': None,
-                'state': None,
-                'zip_code': None,
-                'country': 'USA',
-                'latitude': None,
-                'longitude': None,
-                'category': None,
-                'description': None,
-                'rating': None,
-                'review_count': None,
-                'hours': None,
-                'amenities': None,
-                'images': None,
-            }
-            
-            # Extract source_id from URL
-            match = re.search(r'/([^/]+)\.html', url)
-            if match:
-                business_data['source_id'] = match.group(1)
-            
-            # Extract business name
-            name_selectors = [
-                ('h1', {}),
-                ('h2', {'class': re.compile(r'business-name', re.I)}),
-                ('div', {'class': re.compile(r'business-name', re.I)}),
-            ]
-            
-            for tag, attrs in name_selectors:
-                name_elem = soup.find(tag, attrs)
-                if name_elem:
-                    business_data['name'] = name_elem.get_text(strip=True)
-                    break
-            
-            # Extract phone
-            phone_selectors = [
-                ('div', {'class': re.compile(r'phone', re.I)}),
-                ('a', {'href': re.compile(r'tel:', re.I)}),
-                ('span', {'itemprop': 'telephone'}),
-            ]
-            
-            for tag, attrs in phone_selectors:
-                phone_elem = soup.find(tag, attrs)
-                if phone_elem:
-                    phone_text = phone_elem.get_text(strip=True)
-                    phone_match = re.search(r'[\d\s\-\(\)\.]+', phone_text)
-                    if phone_match:
-                        business_data['phone'] = re.sub(r'\s+', ' ', phone_match.group(0)).strip()
-                        break
-            
-            # Extract address
-            address_selectors = [
-                ('div', {'class': re.compile(r'address', re.I)}),
-                ('span', {'itemprop': 'address'}),
-                ('div', {'itemprop': 'address'}),
-            ]
-            
-            for tag, attrs in address_selectors:
-                address_elem = soup.find(tag, attrs)
-                if address_elem:
-                    address_text = address_elem.get_text(strip=True)
-                    if address_text:
-                        address_parts = self._parse_address(address_text)
-                        business_data.update(address_parts)
-                        break
-            
-            # Extract website
-            website_elem = soup.find('a', href=re.compile(r'^https?://', re.I))
-            if website_elem and 'yellowpages.com' not in website_elem.get('href', '').lower():
-                business_data['website'] = website_elem.get('href', '').strip()
-            
-            # Extract rating
-            rating_elem = soup.find('div', class_=re.compile(r'rating', re.I))
-            if rating_elem:
-                rating_text = rating_elem.get_text(strip=True)
-                business_data['rating'] = self._extract_rating_from_text(rating_text)
-            
-            # Extract review count
-            review_elem = soup.find('span', class_=re.compile(r'review', re.I))
-            if review_elem:
-                review_text = review_elem.get_text(strip=True)
-                business_data['review_count'] = self._extract_review_count(review_text)
+            return self._parse_business_page(response, url)
             
-            # Extract categories
-            category_elems = soup.find_all('a', href=re.compile(r'/search\?search_terms='))
-            categories = []
-            for elem in category_elems[:5]:
-                cat_text = elem.get_text(strip=True)
-                if cat_text and cat_text not in categories:
-                    categories.append(cat_text)
-            if categories:
-                business_data['category'] = ', '.join(categories)
+        except Exception as e:
+            logger.error(f"Error scraping Yellow Pages business {url}: {e}")
+            return None
+    
+    async def scrape_business_async(self, url: str) -> Optional[Dict]:
+        """
+        Scrape a single Yellow Pages business page without blocking the event loop.
+        
+        Args:
+            url: URL of the Yellow Pages business page
             
-            # Extract description
-            desc_elem = soup.find('div', class_=re.compile(r'description|about', re.I))
-            if desc_elem:
-                business_data['description'] = desc_elem.get_text(strip=True)
-            
-            # Extract hours
-            hours_elem = soup.find('div', class_=re.compile(r'hours|schedule', re.I))
-            if hours_elem:
-                business_data['hours'] = hours_elem.get_text(strip=True)
-            
-            # Extract images
-            img_elems = soup.find_all('img', src=re.compile(r'\.(jpg|jpeg|png)', re.I))
-            images = []
-            for img in img_elems[:5]:  # Limit to 5 images
-                img_url = img.get('src', '') or img.get('data-src', '')
-                if img_url:
-                    if img_url.startswith('//'):
-                        img_url = 'https:' + img_url
-                    elif img_url.startswith('/'):
-                        img_url = urljoin(self.base_url, img_url)
-                    images.append(img_url)
-            if images:
-                business_data['images'] = json.dumps(images)
+        Returns:
+            Dictionary containing business data or None if failed
+        """
+        logger.info(f"Scraping Yellow Pages business: {url}")
+        
+        try:
+            if not self.zyte_client:
+                logger.error("Zyte API client not initialized")
+                return None
             
-            return business_data if business_data['name'] else None
+            # Fetch page using Zyte API
+            response = await self.zyte_client.fetch_page_async(url)
+            return self._parse_business_page(response, url)
             
         except Exception as e:
             logger.error(f"Error scraping Yellow Pages business {url}: {e}")
             return None
+    
+    async def scrape_many(
+        self,
+        urls: List[str],
+        max_concurrency: int = 10,
+        save: bool = False
+    ) -> List[Optional[Dict]]:
+        """
+        Scrape many Yellow Pages business pages concurrently.
+        
+        Args:
+            urls: URLs of the Yellow Pages business pages
+            max_concurrency: Maximum number of requests in flight
+            save: Queue each business for the background writer as soon as it
+                is scraped, so database writes overlap with fetching
+                (call commit() afterwards)
+            
+        Returns:
+            List of business data dictionaries (None for failed pages), in the order of urls
+        """
+        if not self.zyte_client:
+            logger.error("Zyte API client not initialized")
+            return []
+        
+        semaphore = asyncio.BoundedSemaphore(max_concurrency)
+        
+        async def bounded_scrape(url: str) -> Optional[Dict]:
+            async with semaphore:
+                business_data = await self.scrape_business_async(url)
+            if save:
+                # May block briefly when the writer queue is full (backpressure)
+                self.queue_business(business_data)
+            return business_data
+        
+        async with self.zyte_client:
+            return await asyncio.gather(*(bounded_scrape(url) for url in urls))
+    
+    def _parse_business_page(self, response: Optional[Dict], url: str) -> Optional[Dict]:
+        """
+        Parse business data from a fetched Yellow Pages business page.
+        
+        Args:
+            response: Zyte API response for the business page
+            url: URL of the Yellow Pages business page
+            
+        Returns:
+            Dictionary containing business data or None if failed
+        """
+        if not response or 'browserHtml' not in response:
+            logger.error(f"No response for business page: {url}")
+            return None
+        
+        html = response['browserHtml']
+        soup = self.zyte_client.parse_html(html, _BUSINESS_PAGE_STRAINER)
+        if not soup:
+            logger.error(f"Failed to parse HTML for business page: {url}")
+            return None
+        
+        business_data = self._BUSINESS_TEMPLATE.copy()
+        business_data['source'] = self.source
+        business_data['source_url'] = url
+        business_data['last_etag'] = ZyteClient.get_header(response, 'ETag')
+        
+        # Extract source_id from URL
+        business_data['source_id'] = _source_id_from_url(url)
+        
+        # Extract business name
+        for tag, attrs in self._NAME_SELECTORS:
+            name_elem = soup.find(tag, attrs)
+            if name_elem:
+                business_data['name'] = name_elem.get_text(strip=True)
+                break
+        
+        # Extract phone
+        for tag, attrs in self._PHONE_SELECTORS:
+            phone_elem = soup.find(tag, attrs)
+            if phone_elem:
+                phone_text = phone_elem.get_text(strip=True)
+                phone_match = _RE_PHONE.search(phone_text)
+                if phone_match:
+                    business_data['phone'] = _RE_WS.sub(' ', phone_match.group(0)).strip()
+                    break
+        
+        # Extract address
+        for tag, attrs in self._ADDRESS_SELECTORS:
+            address_elem = soup.find(tag, attrs)
+            if address_elem:
+                address_text = address_elem.get_text(strip=True)
+                if address_text:
+                    address_parts = self._parse_address(address_text)
+                    business_data.update(address_parts)
+                    break
+        
+        # Extract website
+        website_elem = soup.find('a', href=_is_http_url)
+        if website_elem:
+            href = website_elem.get('href', '')
+            if 'yellowpages.com' not in href.lower():
+                business_data['website'] = href.strip()
+        
+        # Extract rating
+        rating_elem = soup.find('div', class_=_RE_CLS_RATING)
+        if rating_elem:
+            rating_text = rating_elem.get_text(strip=True)
+            business_data['rating'] = self._extract_rating_from_text(rating_text)
+        
+        # Extract review count
+        review_elem = soup.find('span', class_=_RE_CLS_REVIEW)
+        if review_elem:
+            review_text = review_elem.get_text(strip=True)
+            business_data['review_count'] = self._extract_review_count(review_text)
+        
+        # Extract categories
+        category_elems = soup.find_all('a', href=_RE_HREF_CATEGORY)
+        categories = []
+        for elem in category_elems[:5]:
+            cat_text = elem.get_text(strip=True)
+            if cat_text and cat_text not in categories:
+                categories.append(cat_text)
+        if categories:
+            business_data['category'] = sys.intern(', '.join(categories))
+        
+        # Extract description
+        desc_elem = soup.select_one(_DESCRIPTION_SELECTOR)
+        if desc_elem:
+            business_data['description'] = desc_elem.get_text(strip=True)
+        
+        # Extract hours
+        hours_elem = soup.select_one(_HOURS_SELECTOR)
+        if hours_elem:
+            business_data['hours'] = hours_elem.get_text(strip=True)
+        
+        # Extract images
+        img_elems = soup.select(_IMAGE_SELECTOR, limit=5)  # Limit to 5 images
+        images = []
+        for img in img_elems:
+            img_url = img.get('src', '') or img.get('data-src', '')
+            if img_url:
+                if img_url.startswith('//'):
+                    img_url = 'https:' + img_url
+                elif img_url.startswith('/'):
+                    img_url = abs_url(self.base_url, img_url)
+                images.append(img_url)
+        if images:
+            business_data['images'] = images
+        
+        return business_data if business_data['name'] else None
+
+
+def _scrape_category(
+    zyte_api_key: str,
+    business_title: str,
+    location: str,
+    max_pages: Optional[int],
+    request_delay: float
+) -> List[Dict]:
+    """
+    Worker process entry point: scrape one category without a database session.
+    
+    Args:
+        zyte_api_key: Zyte API key
+        business_title: Business category to scrape
+        location: Location to search
+        max_pages: Maximum number of pages to scrape (None for all)
+        request_delay: Seconds between this worker's Zyte requests
+        
+    Returns:
+        List of business data dictionaries
+    """
+    # No response cache: worker processes writing to one SQLite file would
+    # fail with "database is locked"
+    scraper = YellowPagesScraper(
+        None, zyte_api_key, request_delay=request_delay, http_cache=False
+    )
+    return scraper.scrape_by_category_and_location(business_title, location, max_pages=max_pages)
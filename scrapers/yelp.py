@@ -1,23 +1,276 @@
 """Yelp scraper implementation."""
-from typing import Dict, List, Optional
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Set, Tuple
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
 from loguru import logger
 from sqlalchemy.orm import Session
-from urllib.parse import urljoin, urlparse, parse_qs, urlencode, quote_plus
+from urllib.parse import urlparse, parse_qsl, urlencode
+import asyncio
 import re
-import json
-import time
+import sys
+from lxml import etree
 from scrapers.base import BaseScraper
+from utils.urls import abs_url
 from utils.zyte_client import ZyteClient
 
 
+# Text patterns
+_RE_STARS = re.compile(r'(\d+\.?\d*)\s*star', re.I)
+_RE_REVIEW_COUNT = re.compile(r'\((\d+)\s*review', re.I)
+_RE_REVIEW = re.compile(r'(\d+)\s*review', re.I)
+_RE_NUMBER = re.compile(r'(\d+\.?\d*)')
+_RE_BIZ_ID = re.compile(r'/biz/([^/?]+)')
+_RE_SERVING = re.compile(r'Serving\s+([^,]+)')
+_RE_PHONE = re.compile(r'[\d\s\-\(\)]+')
+
+# Attribute patterns of the BeautifulSoup selectors
+_RE_CLS_PHONE = re.compile(r'phone', re.I)
+_RE_HREF_HTTP = re.compile(r'^https?://', re.I)
+_RE_HREF_CATEGORY = re.compile(r'/search\?find_desc=')
+
+# Most search pages fetched at once when the number of pages is unknown
+PAGE_BATCH_SIZE = 10
+
+
+@lru_cache(maxsize=512)
+def _search_query(business_title: str, location: str) -> str:
+    """Encoded query of a search URL (categories are searched again and again)."""
+    return urlencode({'find_desc': business_title, 'find_loc': location})
+
+
+def _cls(name: str) -> str:
+    """XPath test: the class attribute contains the class name."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Search results selectors, compiled once. Each mirrors a find()/find_all()
+# chain of the former BeautifulSoup parsing: [1] steps keep its first-match
+# semantics.
+_MAIN_XPATH = etree.XPath(
+    f"(//main[@id='main-content'][{_cls('searchResultsContainer__09f24__jckwW')}])[1]"
+)
+_PAGINATION_XPATH = etree.XPath(f"(.//div[{_cls('pagination__09f24__D23mv')}])[1]")
+_NEXT_LINK_XPATH = etree.XPath(f"(.//a[{_cls('next-link')}])[1]")
+_NAME_LINK_XPATH = etree.XPath(
+    f"(.//h3[{_cls('y-css-hcgwj4')}])[1]/descendant::a[{_cls('y-css-12f4fi2')}][1]"
+)
+_RATING_XPATH = etree.XPath(f"(.//div[{_cls('y-css-dnttlc')}][@role='img'])[1]")
+_REVIEW_XPATH = etree.XPath("(.//div[@data-traffic-crawl-id='SearchResultBizRating'])[1]")
+_CATEGORIES_XPATH = etree.XPath(
+    f"(.//div[@data-testid='serp-ia-categories'])[1]/descendant::button[{_cls('y-css-4nc3wq')}]"
+)
+_ADDRESS_XPATH = etree.XPath(
+    f"(.//address)[1]/descendant::p[{_cls('y-css-194gzdn')}][1]"
+    f"/descendant::span[{_cls('raw__09f24__T4Ezm')}][1]"
+)
+# City/address block of a listing; the lookups below are relative to it
+_SECONDARY_PATH = (
+    f"(.//div[{_cls('secondaryAttributes__09f24__F0z3u')}])[1]"
+    f"/descendant::div[{_cls('container__09f24__Ommk4')}][1]"
+)
+_SECONDARY_CITY_XPATH = etree.XPath(
+    f"{_SECONDARY_PATH}/descendant::p[{_cls('y-css-194gzdn')}][1]"
+)
+_SECONDARY_ADDRESS_XPATH = etree.XPath(
+    f"{_SECONDARY_PATH}/descendant::address[1]/descendant::p[{_cls('y-css-194gzdn')}][1]"
+    f"/descendant::span[{_cls('raw__09f24__T4Ezm')}][1]"
+)
+_SECONDARY_CITY_DIV_XPATH = etree.XPath(
+    f"{_SECONDARY_PATH}/descendant::div[{_cls('y-css-74ugvt')}][1]"
+    f"/descendant::p[{_cls('y-css-194gzdn')}][1]"
+)
+_TAGS_XPATH = etree.XPath(
+    f".//div[{_cls('tag__09f24__wuJ8a')}][@data-testid='tag']"
+    f"/descendant::span[{_cls('tagText__09f24__OoFU9')}][1]"
+    f"/descendant::span[{_cls('raw__09f24__T4Ezm')}][1]"
+)
+_IMAGE_XPATH = etree.XPath(f"(.//img[{_cls('y-css-fex5b')}])[1]")
+
+# Visible text, skipping script/style contents (as BeautifulSoup's get_text does)
+_TEXT_XPATH = etree.XPath("descendant::text()[not(parent::script) and not(parent::style)]")
+
+
+def _text(element) -> str:
+    """Stripped text of an element, like BeautifulSoup's get_text(strip=True)."""
+    return ''.join(text.strip() for text in _TEXT_XPATH(element))
+
+
+def _first(xpath: etree.XPath, element):
+    """First element matched by a [1]-terminated XPath, or None."""
+    found = xpath(element)
+    return found[0] if found else None
+
+
+# Start tag of the search results container
+_RE_MAIN_START = re.compile(r"""<main\b[^>]*\bid=["']?main-content\b""", re.I)
+
+# Characters of HTML fed to the incremental parser at a time
+_FEED_CHUNK_SIZE = 1 << 16
+
+# Tests for the incremental parse: the results container (as _MAIN_XPATH),
+# listing items, and business listings (results with a business name heading)
+_IS_MAIN_XPATH = etree.XPath(
+    f"self::main[@id='main-content'][{_cls('searchResultsContainer__09f24__jckwW')}]"
+)
+_IS_LISTING_LI_XPATH = etree.XPath(f"self::li[{_cls('y-css-mhg9c5')}]")
+_LISTINGS_OR_SELF_XPATH = etree.XPath(
+    f"descendant-or-self::li[{_cls('y-css-mhg9c5')}][descendant::h3[{_cls('y-css-hcgwj4')}]]"
+)
+
+
+def _feed_search_html(
+    html: str,
+    on_listing: Callable[[Any], None],
+    start: int = 0,
+    end: Optional[int] = None
+):
+    """
+    Parse HTML incrementally, handing over the results container's listings.
+    
+    Each business listing is passed to on_listing as soon as its closing tag
+    is parsed, in document order, and then cleared so the tree doesn't keep
+    every listing of the page.
+    
+    Args:
+        html: HTML to parse
+        on_listing: Called with each listing element
+        start: Offset in html where parsing starts
+        end: Offset in html where parsing stops (None for the end of html)
+        
+    Returns:
+        Tuple of (root <html> element, results container or None)
+    """
+    if end is None:
+        end = len(html)
+    parser = etree.HTMLPullParser(events=('start', 'end'), tag=('main', 'li'))
+    main = None
+    # Only chunk-sized slices of html are copied
+    for offset in range(start, end, _FEED_CHUNK_SIZE):
+        parser.feed(html[offset:min(offset + _FEED_CHUNK_SIZE, end)])
+        for event, element in parser.read_events():
+            if event == 'start':
+                if main is None and element.tag == 'main' and _IS_MAIN_XPATH(element):
+                    main = element
+                continue
+            if main is None or element.tag != 'li' or not _IS_LISTING_LI_XPATH(element):
+                continue
+            # Listings nested in another one are handed over with it
+            ancestor = next(
+                (
+                    ancestor for ancestor in element.iterancestors()
+                    if ancestor is main
+                    or (ancestor.tag == 'li' and _IS_LISTING_LI_XPATH(ancestor))
+                ),
+                None
+            )
+            if ancestor is not main:
+                continue
+            for listing in _LISTINGS_OR_SELF_XPATH(element):
+                on_listing(listing)
+            # Keep the page's pagination if a listing happens to contain it
+            if not _PAGINATION_XPATH(element):
+                element.clear(keep_tail=True)
+    return parser.close(), main
+
+
+def _parse_search_html(html: str, on_listing: Callable[[Any], None]):
+    """
+    Parse a search results page, building only its results container.
+    
+    The markup from the container's start tag to the last </main> is parsed
+    (fed from the page by offsets, not copied out of it), skipping the
+    page's head, scripts, header and footer. If the results
+    container isn't found that way, the whole page is parsed. The page is
+    parsed incrementally: business listings are handed to on_listing while
+    the rest of the page is still being parsed, and released afterwards.
+    
+    Args:
+        html: HTML of the page
+        on_listing: Called with each business listing of the results
+            container, in document order
+        
+    Returns:
+        Root <html> element (without the listings' contents) or None if failed
+    """
+    try:
+        match = _RE_MAIN_START.search(html)
+        end = html.rfind('</main>')
+        if match and end > match.start():
+            document, main = _feed_search_html(
+                html, on_listing, match.start(), end + len('</main>')
+            )
+            if main is not None:
+                return document
+        return _feed_search_html(html, on_listing)[0]
+    except Exception as e:
+        logger.error(f"Error parsing HTML: {e}")
+        return None
+
+
 class YelpScraper(BaseScraper):
     """Scraper for Yelp business listings."""
     
+    __slots__ = ('base_url', 'zyte_client')
+    
+    # Fields of a scraped business, copied for every listing and page
+    _BUSINESS_TEMPLATE = {
+        'name': None,
+        'source': None,
+        'source_url': None,
+        'source_id': None,
+        'phone': None,
+        'email': None,
+        'website': None,
+        'address': None,
+        'city': None,
+        'state': None,
+        'zip_code': None,
+        'country': 'Canada',
+        'latitude': None,
+        'longitude': None,
+        'category': None,
+        'description': None,
+        'rating': None,
+        'review_count': None,
+        'hours': None,
+        'amenities': None,
+        'images': None,
+    }
+    
     def __init__(self, db_session: Session, zyte_api_key: Optional[str] = None):
         super().__init__(db_session, zyte_api_key)
+        self._init_site()
+        self.zyte_client = (
+            ZyteClient(
+                self.zyte_api_key,
+                cache_path=self.http_cache_path,
+                cache_ttl=self.http_cache_ttl,
+                max_retries=self.max_retries,
+                request_delay=self.scraping_delay
+            )
+            if self.zyte_api_key else None
+        )
+    
+    def _init_site(self):
+        """Set the attributes the page parsers use."""
         self.source = "yelp"
         self.base_url = "https://www.yelp.ca"
-        self.zyte_client = ZyteClient(self.zyte_api_key) if self.zyte_api_key else None
+    
+    @classmethod
+    def _parser(cls) -> 'YelpScraper':
+        """
+        Create a scraper that only parses pages (e.g. in a worker process).
+        
+        Unlike the constructor, this opens no Zyte client, response cache or
+        background writer.
+        
+        Returns:
+            YelpScraper without a database session or Zyte client
+        """
+        scraper = cls.__new__(cls)
+        scraper._init_site()
+        return scraper
     
     def build_search_url(self, business_title: str, location: str) -> str:
         """
@@ -34,12 +287,7 @@ class YelpScraper(BaseScraper):
             >>> scraper.build_search_url("Plumbers", "Montreal")
             'https://www.yelp.ca/search?find_desc=Plumbers&find_loc=Montreal'
         """
-        params = {
-            'find_desc': business_title,
-            'find_loc': location
-        }
-        query_string = urlencode(params)
-        return f"{self.base_url}/search?{query_string}"
+        return f"{self.base_url}/search?{_search_query(business_title, location)}"
     
     def scrape_by_category_and_location(
         self, 
@@ -85,8 +333,19 @@ class YelpScraper(BaseScraper):
             >>> results = scraper.scrape_multiple_categories(categories, "Montreal", max_pages_per_category=2)
             >>> print(f"Found {len(results['Plumbers'])} plumbers")
         """
-        results = {}
-        
+        # Commit all categories in one transaction, saving them in batches
+        with self.transactionally():
+            return self._save_categories(
+                self._iter_categories(business_titles, location, max_pages_per_category)
+            )
+    
+    def _iter_categories(
+        self,
+        business_titles: List[str],
+        location: str,
+        max_pages_per_category: Optional[int]
+    ) -> Iterator[Tuple[str, List[Dict]]]:
+        """Scrape categories one after another, yielding (business title, businesses)."""
         for business_title in business_titles:
             logger.info(f"Processing category: {business_title}")
             try:
@@ -95,30 +354,78 @@ class YelpScraper(BaseScraper):
                     location, 
                     max_pages=max_pages_per_category
                 )
-                results[business_title] = businesses
                 logger.info(f"Found {len(businesses)} businesses for {business_title}")
-                
-                # Save businesses to database
-                for business_data in businesses:
-                    if business_data:
-                        self.save_business(business_data)
-                self.commit()
-                
-                # Delay between categories to avoid rate limiting
-                if business_title != business_titles[-1]:  # Don't delay after last category
-                    time.sleep(self.scraping_delay)
-                    
             except Exception as e:
                 logger.error(f"Error scraping {business_title}: {e}")
-                results[business_title] = []
+                businesses = []
+            
+            yield business_title, businesses
+    
+    async def ascrape_multiple_categories(
+        self,
+        business_titles: List[str],
+        location: str,
+        max_pages_per_category: Optional[int] = None,
+        max_concurrency: int = 10,
+        processes: Optional[int] = None
+    ) -> Dict[str, List[Dict]]:
+        """
+        Scrape multiple business categories concurrently.
+        
+        Categories are scraped at once and each fetches its pages in
+        concurrent batches, with at most max_concurrency pages in flight
+        overall. Results are saved once all categories are scraped, in one
+        transaction (batched as in scrape_multiple_categories).
+        
+        Args:
+            business_titles: List of business categories to scrape
+            location: Location to search (e.g., "Montreal", "Toronto, ON")
+            max_pages_per_category: Maximum pages to scrape per category (None for all)
+            max_concurrency: Maximum pages fetched at once
+            processes: Parse pages in this many worker processes, leaving this
+                one to fetching (None to parse here)
+            
+        Returns:
+            Dictionary mapping business titles to lists of business data
+        """
+        if not self.zyte_client:
+            logger.error("Zyte API client not initialized")
+            return {business_title: [] for business_title in business_titles}
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
         
-        return results
+        async def scrape_category(business_title: str) -> List[Dict]:
+            logger.info(f"Processing category: {business_title}")
+            businesses = await self._ascrape_search(
+                self.build_search_url(business_title, location),
+                max_pages_per_category,
+                semaphore,
+                executor
+            )
+            logger.info(f"Found {len(businesses)} businesses for {business_title}")
+            return businesses
+        
+        with self._parse_executor(processes) as executor:
+            async with self.zyte_client:
+                scraped = await asyncio.gather(
+                    *(scrape_category(business_title) for business_title in business_titles)
+                )
+        
+        with self.transactionally():
+            return self._save_categories(zip(business_titles, scraped))
     
     def _extract_rating_from_aria_label(self, element) -> Optional[float]:
         """Extract rating from aria-label attribute."""
         try:
             aria_label = element.get('aria-label', '')
-            match = re.search(r'(\d+\.?\d*)\s*star', aria_label, re.IGNORECASE)
+            # Fast path for the usual "4.5 star rating"; anything else goes
+            # through the regex
+            head, sep, _ = aria_label.partition(' star')
+            if sep and 'star' not in head.casefold():
+                number = head.rpartition(' ')[2]
+                if number[:1].isdecimal() and number.replace('.', '', 1).isdecimal():
+                    return float(number)
+            match = _RE_STARS.search(aria_label)
             if match:
                 return float(match.group(1))
         except Exception:
@@ -128,7 +435,14 @@ class YelpScraper(BaseScraper):
     def _extract_review_count(self, text: str) -> Optional[int]:
         """Extract review count from text like '(1 review)' or '(9 reviews)'."""
         try:
-            match = re.search(r'\((\d+)\s*review', text, re.IGNORECASE)
+            # Fast path for the usual "(12 reviews)"; anything else goes
+            # through the regex
+            _, sep, tail = text.partition('(')
+            if sep:
+                number, space, rest = tail.partition(' ')
+                if space and number.isdecimal() and rest[:6].lower() == 'review':
+                    return int(number)
+            match = _RE_REVIEW_COUNT.search(text)
             if match:
                 return int(match.group(1))
         except Exception:
@@ -138,163 +452,245 @@ class YelpScraper(BaseScraper):
     def _parse_business_from_listing(self, listing_element) -> Optional[Dict]:
         """Parse business data from a search result listing element."""
         try:
-            business_data = {
-                'name': None,
-                'source': self.source,
-                'source_url': None,
-                'source_id': None,
-                'phone': None,
-                'email': None,
-                'website': None,
-                'address': None,
-                'city': None,
-                'state': None,
-                'zip_code': None,
-                'country': 'Canada',
-                'latitude': None,
-                'longitude': None,
-                'category': None,
-                'description': None,
-                'rating': None,
-                'review_count': None,
-                'hours': None,
-                'amenities': None,
-                'images': None,
-            }
-            
-            # Extract business name and URL
-            name_link = listing_element.find('h3', class_='y-css-hcgwj4')
-            if name_link:
-                link = name_link.find('a', class_='y-css-12f4fi2')
-                if link:
-                    business_data['name'] = link.get_text(strip=True)
-                    href = link.get('href', '')
-                    if href:
-                        if href.startswith('/'):
-                            business_data['source_url'] = urljoin(self.base_url, href.split('?')[0])
-                        else:
-                            business_data['source_url'] = href.split('?')[0]
-                        
-                        # Extract source_id from URL (e.g., /biz/swift-home-services-c%C3%B4te-saint-luc-2)
-                        match = re.search(r'/biz/([^/?]+)', business_data['source_url'])
-                        if match:
-                            business_data['source_id'] = match.group(1)
+            # Extract business name and URL first: listings without them
+            # (e.g. ad cards) are skipped before any other lookup
+            link = _first(_NAME_LINK_XPATH, listing_element)
+            if link is None:
+                return None
+            name = _text(link)
+            href = link.get('href', '')
+            if not name or not href:
+                return None
+            if href.startswith('/'):
+                source_url = abs_url(self.base_url, href.split('?')[0])
+            else:
+                source_url = href.split('?')[0]
+            if not source_url:
+                return None
+            
+            business_data = self._BUSINESS_TEMPLATE.copy()
+            business_data['source'] = self.source
+            business_data['name'] = name
+            business_data['source_url'] = source_url
+            
+            # Extract source_id from URL (e.g., /biz/swift-home-services-c%C3%B4te-saint-luc-2)
+            match = _RE_BIZ_ID.search(source_url)
+            if match:
+                business_data['source_id'] = match.group(1)
             
             # Extract rating
-            rating_elem = listing_element.find('div', class_='y-css-dnttlc', role='img')
-            if rating_elem:
+            rating_elem = _first(_RATING_XPATH, listing_element)
+            if rating_elem is not None:
                 business_data['rating'] = self._extract_rating_from_aria_label(rating_elem)
             
             # Extract review count
-            rating_text_elem = listing_element.find('div', attrs={'data-traffic-crawl-id': 'SearchResultBizRating'})
-            if rating_text_elem:
-                review_text = rating_text_elem.get_text(strip=True)
+            rating_text_elem = _first(_REVIEW_XPATH, listing_element)
+            if rating_text_elem is not None:
+                review_text = _text(rating_text_elem)
                 business_data['review_count'] = self._extract_review_count(review_text)
             
             # Extract categories
-            categories_elem = listing_element.find('div', attrs={'data-testid': 'serp-ia-categories'})
-            if categories_elem:
-                category_buttons = categories_elem.find_all('button', class_='y-css-4nc3wq')
-                categories = [btn.get_text(strip=True) for btn in category_buttons]
-                if categories:
-                    business_data['category'] = ', '.join(categories)
+            categories = [_text(btn) for btn in _CATEGORIES_XPATH(listing_element)]
+            if categories:
+                # Categories, cities and tags repeat across listings: intern them
+                # so the records held until they are saved share one copy of each
+                business_data['category'] = sys.intern(', '.join(categories))
             
             # Extract address
-            address_elem = listing_element.find('address')
-            if address_elem:
-                address_p = address_elem.find('p', class_='y-css-194gzdn')
-                if address_p:
-                    address_span = address_p.find('span', class_='raw__09f24__T4Ezm')
-                    if address_span:
-                        business_data['address'] = address_span.get_text(strip=True)
+            address_span = _first(_ADDRESS_XPATH, listing_element)
+            if address_span is not None:
+                business_data['address'] = _text(address_span)
             
             # Extract city/area
-            secondary_attrs = listing_element.find('div', class_='secondaryAttributes__09f24__F0z3u')
-            if secondary_attrs:
-                container = secondary_attrs.find('div', class_='container__09f24__Ommk4')
-                if container:
-                    # Try to find city in paragraph
-                    city_p = container.find('p', class_='y-css-194gzdn')
-                    if city_p:
-                        city_text = city_p.get_text(strip=True)
-                        # Handle "Serving X and the Surrounding Area" or just city name
-                        if 'Serving' in city_text:
-                            match = re.search(r'Serving\s+([^,]+)', city_text)
-                            if match:
-                                business_data['city'] = match.group(1).strip()
-                        else:
-                            business_data['city'] = city_text
-                    
-                    # Try to find address in address tag
-                    address_tag = container.find('address')
-                    if address_tag:
-                        address_p = address_tag.find('p', class_='y-css-194gzdn')
-                        if address_p:
-                            address_span = address_p.find('span', class_='raw__09f24__T4Ezm')
-                            if address_span:
-                                business_data['address'] = address_span.get_text(strip=True)
-                    
-                    # Try to find city in div after address
-                    city_div = container.find('div', class_='y-css-74ugvt')
-                    if city_div:
-                        city_p = city_div.find('p', class_='y-css-194gzdn')
-                        if city_p:
-                            business_data['city'] = city_p.get_text(strip=True)
+            # Try to find city in paragraph
+            city_p = _first(_SECONDARY_CITY_XPATH, listing_element)
+            if city_p is not None:
+                city_text = _text(city_p)
+                # Handle "Serving X and the Surrounding Area" or just city name
+                if 'Serving' in city_text:
+                    match = _RE_SERVING.search(city_text)
+                    if match:
+                        business_data['city'] = sys.intern(match.group(1).strip())
+                else:
+                    business_data['city'] = sys.intern(city_text)
             
-            # Extract amenities/tags
-            tags = []
-            tag_elements = listing_element.find_all('div', class_='tag__09f24__wuJ8a', attrs={'data-testid': 'tag'})
-            for tag_elem in tag_elements:
-                tag_text_elem = tag_elem.find('span', class_='tagText__09f24__OoFU9')
-                if tag_text_elem:
-                    tag_span = tag_text_elem.find('span', class_='raw__09f24__T4Ezm')
-                    if tag_span:
-                        tags.append(tag_span.get_text(strip=True))
+            # Try to find address in address tag
+            address_span = _first(_SECONDARY_ADDRESS_XPATH, listing_element)
+            if address_span is not None:
+                business_data['address'] = _text(address_span)
+            
+            # Try to find city in div after address
+            city_p = _first(_SECONDARY_CITY_DIV_XPATH, listing_element)
+            if city_p is not None:
+                business_data['city'] = sys.intern(_text(city_p))
             
+            # Extract amenities/tags
+            tags = [sys.intern(_text(tag_span)) for tag_span in _TAGS_XPATH(listing_element)]
             if tags:
-                business_data['amenities'] = json.dumps(tags)
+                business_data['amenities'] = tags
             
             # Extract image URL
-            img_elem = listing_element.find('img', class_='y-css-fex5b')
-            if img_elem:
+            img_elem = _first(_IMAGE_XPATH, listing_element)
+            if img_elem is not None:
                 img_url = img_elem.get('src', '')
                 if img_url:
-                    business_data['images'] = json.dumps([img_url])
+                    business_data['images'] = [img_url]
             
-            return business_data if business_data['name'] and business_data['source_url'] else None
+            return business_data
             
         except Exception as e:
             logger.error(f"Error parsing business listing: {e}")
             return None
     
-    def scrape_businesses_from_search(self, search_url: str, max_pages: Optional[int] = None) -> List[Dict]:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _page_url_prefix(search_url: str) -> str:
         """
-        Scrape businesses directly from search results (more efficient than visiting each page).
+        Build the URL of a search results page, up to its start parameter's value.
+        
+        The URL is parsed and its query encoded once per search; the URL of
+        a page is then the prefix followed by the offset of its first result.
         
         Args:
-            search_url: URL of the Yelp search results page
-            max_pages: Maximum number of pages to scrape (None for all)
+            search_url: URL of the first page
             
         Returns:
-            List of business data dictionaries
+            URL ending in 'start=', with properly encoded query parameters
         """
-        logger.info(f"Scraping businesses from Yelp search results: {search_url}")
+        parsed_url = urlparse(search_url)
+        query_params = dict(parse_qsl(parsed_url.query))
+        query_params.pop('start', None)
+        query = urlencode({**query_params, 'start': ''})
+        return parsed_url._replace(query=query, fragment='').geturl()
+    
+    def _search_results_container(self, document, page: int):
+        """Main container of a search results page (None, logged, if missing)."""
+        main = _first(_MAIN_XPATH, document)
+        if main is None:
+            logger.warning(f"Main container not found on page {page}")
+        return main
+    
+    def _has_next_page(self, main, page_results: List) -> bool:
+        """Whether to fetch the page after one with these results."""
+        # Check if there are more pages
+        pagination = _first(_PAGINATION_XPATH, main)
+        if pagination is None or not page_results:
+            logger.info("No more pages or no businesses found")
+            return False
         
-        businesses = []
+        # Check for next page link
+        if _first(_NEXT_LINK_XPATH, pagination) is None:
+            logger.info("No next page link found")
+            return False
+        
+        return True
+    
+    def _parse_search_page(self, html: str, page: int) -> Tuple[List[Dict], bool]:
+        """
+        Parse the business listings of one page of search results.
+        
+        Args:
+            html: HTML of the page
+            page: Page number (for logging)
+            
+        Returns:
+            Tuple of (businesses found on the page, whether to fetch the next page)
+        """
+        # Parse business listings as the page is parsed
+        page_businesses = []
+        
+        def on_listing(listing):
+            business_data = self._parse_business_from_listing(listing)
+            if business_data:
+                page_businesses.append(business_data)
+        
+        document = _parse_search_html(html, on_listing)
+        if document is None:
+            logger.warning(f"Failed to parse HTML for page {page}")
+            return [], False
+        
+        main = self._search_results_container(document, page)
+        if main is None:
+            return [], False
+        
+        logger.info(f"Found {len(page_businesses)} businesses on page {page}")
+        
+        return page_businesses, self._has_next_page(main, page_businesses)
+    
+    def _parse_business_urls(
+        self,
+        html: str,
+        page: int,
+        seen_urls: Set[str]
+    ) -> Tuple[List[str], bool]:
+        """
+        Parse the business page URLs of one page of search results.
+        
+        Args:
+            html: HTML of the page
+            page: Page number (for logging)
+            seen_urls: URLs found on previous pages; new URLs are added to it
+            
+        Returns:
+            Tuple of (new URLs found on the page, whether to fetch the next page)
+        """
+        # Collect business listing URLs as the page is parsed
+        page_business_urls = []
+        
+        def on_listing(listing):
+            link = _first(_NAME_LINK_XPATH, listing)
+            if link is not None:
+                href = link.get('href', '')
+                if href and '/biz/' in href:
+                    if href.startswith('/'):
+                        full_url = abs_url(self.base_url, href.split('?')[0])
+                    else:
+                        full_url = href.split('?')[0]
+                    
+                    if full_url not in seen_urls:
+                        seen_urls.add(full_url)
+                        page_business_urls.append(full_url)
+        
+        document = _parse_search_html(html, on_listing)
+        if document is None:
+            logger.warning(f"Failed to parse HTML for page {page}")
+            return [], False
+        
+        main = self._search_results_container(document, page)
+        if main is None:
+            return [], False
+        
+        logger.info(f"Found {len(page_business_urls)} businesses on page {page}")
+        
+        return page_business_urls, self._has_next_page(main, page_business_urls)
+    
+    def _iter_search_pages(
+        self,
+        search_url: str,
+        max_pages: Optional[int],
+        parse_page: Callable[[str, int], Tuple[List, bool]]
+    ) -> Iterator[List]:
+        """
+        Fetch and parse search results pages one after another.
+        
+        Args:
+            search_url: URL of the Yelp search results page
+            max_pages: Maximum number of pages to scrape (None for all)
+            parse_page: Function parsing a page's HTML and its page number
+                into (results, whether to fetch the next page)
+            
+        Yields:
+            Results of each page
+        """
         page = 0
         start = 0
+        page_url_prefix = self._page_url_prefix(search_url)
         
         try:
             while True:
-                # Build URL with pagination
-                if page > 0:
-                    parsed_url = urlparse(search_url)
-                    query_params = parse_qs(parsed_url.query)
-                    query_params['start'] = [str(start)]
-                    new_query = '&'.join([f"{k}={v[0]}" for k, v in query_params.items()])
-                    current_url = f"{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}?{new_query}"
-                else:
-                    current_url = search_url
+                current_url = (
+                    f"{page_url_prefix}{start}" if page > 0 else search_url
+                )
                 
                 logger.info(f"Fetching page {page + 1}: {current_url}")
                 
@@ -308,43 +704,9 @@ class YelpScraper(BaseScraper):
                     logger.warning(f"No response for page {page + 1}")
                     break
                 
-                html = response['browserHtml']
-                soup = self.zyte_client.parse_html(html)
-                if not soup:
-                    logger.warning(f"Failed to parse HTML for page {page + 1}")
-                    break
-                
-                # Find main container
-                main = soup.find('main', id='main-content', class_='searchResultsContainer__09f24__jckwW')
-                if not main:
-                    logger.warning(f"Main container not found on page {page + 1}")
-                    break
-                
-                # Find all business listings
-                listings = main.find_all('li', class_='y-css-mhg9c5')
-                page_businesses = []
-                
-                for listing in listings:
-                    # Check if this is a business listing (has business name)
-                    name_link = listing.find('h3', class_='y-css-hcgwj4')
-                    if name_link:
-                        business_data = self._parse_business_from_listing(listing)
-                        if business_data:
-                            page_businesses.append(business_data)
-                            businesses.append(business_data)
-                
-                logger.info(f"Found {len(page_businesses)} businesses on page {page + 1}")
-                
-                # Check if there are more pages
-                pagination = main.find('div', class_='pagination__09f24__D23mv')
-                if not pagination or not page_businesses:
-                    logger.info("No more pages or no businesses found")
-                    break
-                
-                # Check for next page link
-                next_link = pagination.find('a', class_='next-link')
-                if not next_link:
-                    logger.info("No next page link found")
+                page_results, has_next_page = parse_page(response['browserHtml'], page + 1)
+                yield page_results
+                if not has_next_page:
                     break
                 
                 page += 1
@@ -353,121 +715,197 @@ class YelpScraper(BaseScraper):
                 if max_pages and page >= max_pages:
                     logger.info(f"Reached max pages limit: {max_pages}")
                     break
-                
-                # Delay between requests
-                time.sleep(self.scraping_delay)
-            
-            logger.info(f"Total businesses scraped: {len(businesses)}")
-            return businesses
             
         except Exception as e:
-            logger.error(f"Error scraping businesses from search results {search_url}: {e}")
-            return businesses
+            logger.error(f"Error scraping Yelp search results {search_url}: {e}")
     
-    def scrape_search_results(self, search_url: str, max_pages: Optional[int] = None) -> List[str]:
+    def scrape_businesses_from_search(self, search_url: str, max_pages: Optional[int] = None) -> List[Dict]:
         """
-        Scrape Yelp search results to get business URLs.
+        Scrape businesses directly from search results (more efficient than visiting each page).
         
         Args:
             search_url: URL of the Yelp search results page
             max_pages: Maximum number of pages to scrape (None for all)
             
         Returns:
-            List of business page URLs
+            List of business data dictionaries
         """
-        logger.info(f"Scraping Yelp search results: {search_url}")
+        logger.info(f"Scraping businesses from Yelp search results: {search_url}")
         
-        business_urls = []
+        businesses = []
+        for page_businesses in self._iter_search_pages(
+            search_url, max_pages, self._parse_search_page
+        ):
+            businesses.extend(page_businesses)
+        
+        logger.info(f"Total businesses scraped: {len(businesses)}")
+        return businesses
+    
+    async def _scrape_page(
+        self,
+        url: str,
+        page: int,
+        semaphore: asyncio.Semaphore,
+        executor: Optional[Executor] = None
+    ) -> Tuple[List[Dict], bool]:
+        """
+        Fetch and parse one page of search results.
+        
+        Args:
+            url: URL of the page
+            page: Page number (for logging)
+            semaphore: Semaphore bounding the number of pages fetched at once
+            executor: Worker processes parsing the page (None to parse here)
+            
+        Returns:
+            Tuple of (businesses found on the page, whether to fetch the next page)
+        """
+        async with semaphore:
+            logger.info(f"Fetching page {page}: {url}")
+            response = await self.zyte_client.fetch_page_async(url)
+        
+        if not response or 'browserHtml' not in response:
+            logger.warning(f"No response for page {page}")
+            return [], False
+        
+        if executor is not None:
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, _parse_search_page_html, response['browserHtml'], page
+            )
+        
+        return self._parse_search_page(response['browserHtml'], page)
+    
+    async def ascrape_businesses_from_search(
+        self,
+        search_url: str,
+        max_pages: Optional[int] = None,
+        max_concurrency: int = 10,
+        processes: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Async version of scrape_businesses_from_search, fetching pages concurrently.
+        
+        Args:
+            search_url: URL of the Yelp search results page
+            max_pages: Maximum number of pages to scrape (None for all)
+            max_concurrency: Maximum pages fetched at once
+            processes: Parse pages in this many worker processes, leaving this
+                one to fetching (None to parse here)
+            
+        Returns:
+            List of business data dictionaries
+        """
+        if not self.zyte_client:
+            logger.error("Zyte API client not initialized")
+            return []
+        
+        with self._parse_executor(processes) as executor:
+            async with self.zyte_client:
+                return await self._ascrape_search(
+                    search_url, max_pages, asyncio.Semaphore(max_concurrency), executor
+                )
+    
+    @staticmethod
+    def _parse_executor(processes: Optional[int]) -> ContextManager[Optional[Executor]]:
+        """Pool of worker processes parsing search pages (a None placeholder if not processes)."""
+        if not processes:
+            return nullcontext()
+        return ProcessPoolExecutor(max_workers=processes, initializer=_init_parse_worker)
+    
+    async def _ascrape_search(
+        self,
+        search_url: str,
+        max_pages: Optional[int],
+        semaphore: asyncio.Semaphore,
+        executor: Optional[Executor] = None
+    ) -> List[Dict]:
+        """
+        Scrape search results, fetching pages in concurrent batches.
+        
+        Page 1 is fetched alone; each following batch is twice as large as
+        the previous one, up to PAGE_BATCH_SIZE pages. Each batch is processed
+        in page order and scraping stops at the first page without a next
+        page, so the result matches scrape_businesses_from_search. A
+        single-page search costs one request, and the pages fetched past the
+        last one are at most as many as the pages before it (and fewer than
+        PAGE_BATCH_SIZE).
+        
+        Args:
+            search_url: URL of the Yelp search results page
+            max_pages: Maximum number of pages to scrape (None for all)
+            semaphore: Semaphore bounding the number of pages fetched at once
+                (shared between searches scraped concurrently)
+            executor: Worker processes parsing the pages (None to parse here)
+            
+        Returns:
+            List of business data dictionaries
+        """
+        logger.info(f"Scraping businesses from Yelp search results: {search_url}")
+        
+        businesses = []
         page = 0
-        start = 0
+        batch_size = 1
+        page_url_prefix = self._page_url_prefix(search_url)
         
         try:
             while True:
-                # Build URL with pagination
-                if page > 0:
-                    parsed_url = urlparse(search_url)
-                    query_params = parse_qs(parsed_url.query)
-                    query_params['start'] = [str(start)]
-                    new_query = '&'.join([f"{k}={v[0]}" for k, v in query_params.items()])
-                    current_url = f"{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}?{new_query}"
-                else:
-                    current_url = search_url
-                
-                logger.info(f"Fetching page {page + 1}: {current_url}")
-                
-                # Fetch page using Zyte API
-                if not self.zyte_client:
-                    logger.error("Zyte API client not initialized")
-                    break
-                
-                response = self.zyte_client.fetch_page(current_url)
-                if not response or 'browserHtml' not in response:
-                    logger.warning(f"No response for page {page + 1}")
-                    break
-                
-                html = response['browserHtml']
-                soup = self.zyte_client.parse_html(html)
-                if not soup:
-                    logger.warning(f"Failed to parse HTML for page {page + 1}")
-                    break
-                
-                # Find main container
-                main = soup.find('main', id='main-content', class_='searchResultsContainer__09f24__jckwW')
-                if not main:
-                    logger.warning(f"Main container not found on page {page + 1}")
-                    break
-                
-                # Find all business listings
-                listings = main.find_all('li', class_='y-css-mhg9c5')
-                page_business_urls = []
-                
-                for listing in listings:
-                    # Check if this is a business listing (has business name)
-                    name_link = listing.find('h3', class_='y-css-hcgwj4')
-                    if name_link:
-                        link = name_link.find('a', class_='y-css-12f4fi2')
-                        if link:
-                            href = link.get('href', '')
-                            if href and '/biz/' in href:
-                                if href.startswith('/'):
-                                    full_url = urljoin(self.base_url, href.split('?')[0])
-                                else:
-                                    full_url = href.split('?')[0]
-                                
-                                if full_url not in business_urls:
-                                    business_urls.append(full_url)
-                                    page_business_urls.append(full_url)
-                
-                logger.info(f"Found {len(page_business_urls)} businesses on page {page + 1}")
-                
-                # Check if there are more pages
-                pagination = main.find('div', class_='pagination__09f24__D23mv')
-                if not pagination or not page_business_urls:
-                    logger.info("No more pages or no businesses found")
-                    break
+                last_page = page + batch_size
+                if max_pages:
+                    last_page = min(last_page, max_pages)
+                page_urls = [
+                    f"{page_url_prefix}{p * 10}" if p > 0 else search_url
+                    for p in range(page, last_page)
+                ]
+                scraped = await asyncio.gather(*(
+                    self._scrape_page(url, p + 1, semaphore, executor)
+                    for p, url in enumerate(page_urls, start=page)
+                ))
                 
-                # Check for next page link
-                next_link = pagination.find('a', class_='next-link')
-                if not next_link:
-                    logger.info("No next page link found")
+                for page_businesses, has_next_page in scraped:
+                    businesses.extend(page_businesses)
+                    page += 1
+                    if not has_next_page:
+                        break
+                if not has_next_page:
                     break
                 
-                page += 1
-                start += 10
-                
                 if max_pages and page >= max_pages:
                     logger.info(f"Reached max pages limit: {max_pages}")
                     break
                 
-                # Delay between requests
-                time.sleep(self.scraping_delay)
+                batch_size = min(batch_size * 2, PAGE_BATCH_SIZE)
             
-            logger.info(f"Total business URLs found: {len(business_urls)}")
-            return business_urls
+            logger.info(f"Total businesses scraped: {len(businesses)}")
+            return businesses
             
         except Exception as e:
-            logger.error(f"Error scraping Yelp search results {search_url}: {e}")
-            return business_urls
+            logger.error(f"Error scraping businesses from search results {search_url}: {e}")
+            return businesses
+    
+    def scrape_search_results(self, search_url: str, max_pages: Optional[int] = None) -> List[str]:
+        """
+        Scrape Yelp search results to get business URLs.
+        
+        Args:
+            search_url: URL of the Yelp search results page
+            max_pages: Maximum number of pages to scrape (None for all)
+            
+        Returns:
+            List of business page URLs
+        """
+        logger.info(f"Scraping Yelp search results: {search_url}")
+        
+        business_urls = []
+        seen_urls = set()
+        for page_business_urls in self._iter_search_pages(
+            search_url,
+            max_pages,
+            lambda html, page: self._parse_business_urls(html, page, seen_urls)
+        ):
+            business_urls.extend(page_business_urls)
+        
+        logger.info(f"Total business URLs found: {len(business_urls)}")
+        return business_urls
     
     def scrape_business_from_listing(self, listing_element) -> Optional[Dict]:
         """
@@ -475,7 +913,8 @@ class YelpScraper(BaseScraper):
         This is more efficient than visiting each business page.
         
         Args:
-            listing_element: BeautifulSoup element of a business listing
+            listing_element: lxml element of a business listing
+                (from a page parsed with ZyteClient.parse_html_lxml)
             
         Returns:
             Dictionary containing business data or None if failed
@@ -511,32 +950,13 @@ class YelpScraper(BaseScraper):
                 logger.error(f"Failed to parse HTML for business page: {url}")
                 return None
             
-            business_data = {
-                'name': None,
-                'source': self.source,
-                'source_url': url,
-                'source_id': None,
-                'phone': None,
-                'email': None,
-                'website': None,
-                'address': None,
-                'city': None,
-                'state': None,
-                'zip_code': None,
-                'country': 'Canada',
-                'latitude': None,
-                'longitude': None,
-                'category': None,
-                'description': None,
-                'rating': None,
-                'review_count': None,
-                'hours': None,
-                'amenities': None,
-                'images': None,
-            }
+            business_data = self._BUSINESS_TEMPLATE.copy()
+            business_data['source'] = self.source
+            business_data['source_url'] = url
+            business_data['last_etag'] = ZyteClient.get_header(response, 'ETag')
             
             # Extract source_id from URL
-            match = re.search(r'/biz/([^/?]+)', url)
+            match = _RE_BIZ_ID.search(url)
             if match:
                 business_data['source_id'] = match.group(1)
             
@@ -549,11 +969,11 @@ class YelpScraper(BaseScraper):
             rating_elem = soup.find('div', attrs={'data-testid': 'rating'})
             if rating_elem:
                 rating_text = rating_elem.get_text(strip=True)
-                rating_match = re.search(r'(\d+\.?\d*)', rating_text)
+                rating_match = _RE_NUMBER.search(rating_text)
                 if rating_match:
                     business_data['rating'] = float(rating_match.group(1))
                 
-                review_match = re.search(r'(\d+)\s*review', rating_text, re.IGNORECASE)
+                review_match = _RE_REVIEW.search(rating_text)
                 if review_match:
                     business_data['review_count'] = int(review_match.group(1))
             
@@ -565,30 +985,54 @@ class YelpScraper(BaseScraper):
                     business_data['address'] = ', '.join(address_parts)
             
             # Extract phone
-            phone_elem = soup.find('p', class_=re.compile('phone', re.I))
+            phone_elem = soup.find('p', class_=_RE_CLS_PHONE)
             if phone_elem:
                 phone_text = phone_elem.get_text(strip=True)
-                phone_match = re.search(r'[\d\s\-\(\)]+', phone_text)
+                phone_match = _RE_PHONE.search(phone_text)
                 if phone_match:
                     business_data['phone'] = phone_match.group(0).strip()
             
             # Extract website
-            website_elem = soup.find('a', href=re.compile(r'^https?://', re.I))
+            website_elem = soup.find('a', href=_RE_HREF_HTTP)
             if website_elem and 'biz' not in website_elem.get('href', ''):
                 business_data['website'] = website_elem.get('href', '').strip()
             
             # Extract categories
-            category_elems = soup.find_all('a', href=re.compile(r'/search\?find_desc='))
+            category_elems = soup.find_all('a', href=_RE_HREF_CATEGORY)
             categories = []
             for elem in category_elems[:5]:  # Limit to first 5
                 cat_text = elem.get_text(strip=True)
                 if cat_text:
                     categories.append(cat_text)
             if categories:
-                business_data['category'] = ', '.join(categories)
+                business_data['category'] = sys.intern(', '.join(categories))
             
             return business_data if business_data['name'] else None
             
         except Exception as e:
             logger.error(f"Error scraping Yelp business {url}: {e}")
             return None
+
+
+# Scraper parsing search pages in a worker process (see _init_parse_worker)
+_worker_scraper: Optional[YelpScraper] = None
+
+
+def _init_parse_worker():
+    """Worker process initializer: create the scraper parsing this process's pages."""
+    global _worker_scraper
+    _worker_scraper = YelpScraper._parser()
+
+
+def _parse_search_page_html(html: str, page: int) -> Tuple[List[Dict], bool]:
+    """
+    Worker process entry point: parse one page of search results.
+    
+    Args:
+        html: HTML of the page
+        page: Page number (for logging)
+        
+    Returns:
+        Tuple of (businesses found on the page, whether to fetch the next page)
+    """
+    return _worker_scraper._parse_search_page(html, page)
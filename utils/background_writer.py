@@ -0,0 +1,101 @@
+"""Background thread that saves queued rows in batches."""
+from typing import Callable, Dict, List, Optional
+from loguru import logger
+import queue
+import threading
+import time
+
+
+class BackgroundWriter:
+    """Consumes rows from a bounded queue and hands them to a save function in batches."""
+
+    def __init__(
+        self,
+        save: Callable[[List[Dict]], int],
+        batch_size: int = 1000,
+        flush_interval: float = 0.5,
+        max_queue_size: int = 500
+    ):
+        """
+        Initialize the writer. The thread is started on the first put().
+
+        Args:
+            save: Function saving a batch of rows (called from the writer thread)
+            batch_size: Maximum number of rows per save call
+            flush_interval: Maximum seconds a queued row waits before being saved
+            max_queue_size: Maximum number of queued rows; put() blocks when full
+        """
+        self._save = save
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._error: Optional[Exception] = None
+
+    def put(self, row: Dict):
+        """
+        Queue a row for saving, blocking while the queue is full.
+
+        Args:
+            row: Row to save
+
+        Raises:
+            Exception: The error of the first previously failed batch
+        """
+        self._raise_error()
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="background-writer", daemon=True
+                    )
+                    self._thread.start()
+        self._queue.put(row)
+
+    def flush(self):
+        """
+        Block until every queued row has been saved.
+
+        Raises:
+            Exception: The error of the first failed batch
+        """
+        if self._thread is not None:
+            self._queue.join()
+        self._raise_error()
+
+    def _raise_error(self):
+        """Re-raise (once) an error raised by the save function."""
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _run(self):
+        """Writer loop: save a batch when it is full or flush_interval has passed."""
+        batch: List[Dict] = []
+        deadline = 0.0
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if batch else None
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+                if len(batch) == 1:
+                    deadline = time.monotonic() + self.flush_interval
+                if len(batch) < self.batch_size:
+                    continue
+            except queue.Empty:
+                pass
+            self._write(batch)
+            batch = []
+
+    def _write(self, batch: List[Dict]):
+        """Save one batch and mark its rows as done."""
+        try:
+            self._save(batch)
+        except Exception as e:
+            logger.error(f"Error saving {len(batch)} queued rows: {e}")
+            # Keep the first error: later ones may only be its consequences
+            if self._error is None:
+                self._error = e
+        finally:
+            for _ in batch:
+                self._queue.task_done()
@@ -0,0 +1,28 @@
+"""Event loop selection for the async scrapers."""
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+T = TypeVar("T")
+
+
+def run_async(main: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on a fresh event loop.
+    
+    Uses uvloop (libuv) when installed, which has cheaper socket I/O than the
+    default asyncio loop at high concurrency; falls back to asyncio otherwise.
+    
+    Args:
+        main: Coroutine to run
+        
+    Returns:
+        The coroutine's result
+    """
+    if uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
@@ -0,0 +1,97 @@
+"""On-disk cache of Zyte API responses."""
+from typing import Optional, Dict, Any, NamedTuple
+import orjson
+import sqlite3
+import threading
+import time
+
+
+class CachedResponse(NamedTuple):
+    """A cached Zyte API response and the page's HTTP validators."""
+
+    body: Dict[str, Any]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+
+class ResponseCache:
+    """SQLite-backed cache of Zyte API responses keyed by request."""
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, "
+            "etag TEXT, "
+            "last_modified TEXT, "
+            "body TEXT NOT NULL, "
+            "fetched_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key of the request
+
+        Returns:
+            CachedResponse or None if not cached
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, fetched_at FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+        if not row:
+            return None
+        body, etag, last_modified, fetched_at = row
+        return CachedResponse(orjson.loads(body), etag, last_modified, fetched_at)
+
+    def set(
+        self,
+        key: str,
+        body: Dict[str, Any],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ):
+        """
+        Store a response, replacing any previous entry for the key.
+
+        Args:
+            key: Cache key of the request
+            body: Zyte API response
+            etag: ETag header of the fetched page
+            last_modified: Last-Modified header of the fetched page
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, etag, last_modified, body, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, etag, last_modified, orjson.dumps(body).decode(), time.time())
+            )
+            self._conn.commit()
+
+    def touch(self, key: str):
+        """
+        Mark a cached response as fetched now (e.g. after revalidating it).
+
+        Args:
+            key: Cache key of the request
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET fetched_at = ? WHERE key = ?",
+                (time.time(), key)
+            )
+            self._conn.commit()
@@ -0,0 +1,48 @@
+"""Token-bucket rate limiter shared by sync and async requests."""
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """Token bucket allowing up to `rate` requests per second on average."""
+
+    def __init__(self, rate: float):
+        """
+        Initialize the limiter with a full bucket.
+
+        Args:
+            rate: Requests per second; also the bucket size (at least 1),
+                i.e. how many requests may burst after an idle second
+        """
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """
+        Take a token, going into debt if the bucket is empty.
+
+        Returns:
+            Seconds to wait before the reserved token is available
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            self.tokens -= 1
+            return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+    def wait(self):
+        """Block until a request may be sent."""
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire(self):
+        """Wait, without blocking the event loop, until a request may be sent."""
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
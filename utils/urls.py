@@ -0,0 +1,27 @@
+"""URL helpers for scraped links."""
+from urllib.parse import urljoin
+import re
+
+# Paths urljoin would normalize: scheme-relative paths, dot segments,
+# parameters, queries, fragments, and tabs/newlines (which it removes)
+_RE_NEEDS_URLJOIN = re.compile(r'^//|/\.|[;?#\t\r\n]')
+
+
+def abs_url(base_url: str, path: str) -> str:
+    """
+    Resolve a root-relative path (e.g. '/biz/joes-plumbing') against a site's base URL.
+
+    Same result as urljoin(base_url, path), but plain paths are concatenated
+    instead of parsing both URLs; only paths urljoin would normalize go
+    through it.
+
+    Args:
+        base_url: Scheme and host of the site, without a trailing slash
+        path: Path starting with '/'
+
+    Returns:
+        Absolute URL
+    """
+    if _RE_NEEDS_URLJOIN.search(path):
+        return urljoin(base_url, path)
+    return base_url + path
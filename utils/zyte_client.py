@@ -1,24 +1,231 @@
 """Zyte API client utility."""
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any
 from loguru import logger
 import json
-import time
+import httpx
+import orjson
 import requests
-from bs4 import BeautifulSoup
+import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from utils.http_cache import ResponseCache, CachedResponse
+from utils.rate_limiter import RateLimiter
+
+if TYPE_CHECKING:
+    # HTML parsers are imported on first use, so fetching pages (and
+    # importing this module) doesn't load them
+    from bs4 import BeautifulSoup, SoupStrainer
+    from lxml.html import HtmlElement
 
 
 class ZyteClient:
     """Client for interacting with Zyte API."""
     
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        cache_path: Optional[str] = None,
+        cache_ttl: Optional[float] = None,
+        max_retries: int = 3,
+        request_delay: float = 0
+    ):
         """
         Initialize Zyte API client.
         
         Args:
             api_key: Zyte API key
+            cache_path: Path of an SQLite file caching responses (None to disable).
+                Cached pages are revalidated with If-None-Match/If-Modified-Since
+                and reused when the site answers 304 Not Modified. Revalidating
+                is a separate Zyte request, so a changed page costs two requests:
+                the cache pays off when most pages are unchanged.
+            cache_ttl: Seconds a cached page is reused without revalidation
+                (None to always revalidate)
+            max_retries: Retries of a request failing with a connection error,
+                429 or 5xx (with exponential backoff, honouring Retry-After)
+            request_delay: Average seconds between Zyte API requests, enforced
+                by a token bucket shared by sync and async fetches (0 for no limit)
         """
         self.api_key = api_key
         self.base_url = "https://api.zyte.com/v1/extract"
+        self.max_retries = max_retries
+        self.cache = ResponseCache(cache_path) if cache_path else None
+        self.cache_ttl = cache_ttl
+        self.limiter = RateLimiter(1 / request_delay) if request_delay else None
+        self._session = self._new_session()
+        self._async_client: Optional[httpx.AsyncClient] = None
+        # Open ``async with client:`` blocks sharing _async_client
+        self._async_users = 0
+    
+    def _new_session(self) -> requests.Session:
+        """Create a pooled HTTP session retrying failed Zyte API requests."""
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            # Zyte API requests are POSTs but safe to repeat
+            allowed_methods=None,
+            raise_on_status=False
+        )
+        session = requests.Session()
+        # Zyte API uses HTTP Basic Auth with API key as username and empty password
+        session.auth = (self.api_key, "")
+        session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=retry)
+        )
+        return session
+    
+    def close(self):
+        """Close the pooled HTTP session."""
+        self._session.close()
+    
+    async def __aenter__(self) -> "ZyteClient":
+        """
+        Open a pooled async HTTP client shared by fetch_page_async calls.
+        
+        Blocks may be nested or run concurrently: they share one client,
+        closed when the last of them exits.
+        """
+        if not self._async_users:
+            self._async_client = self._new_async_client()
+        self._async_users += 1
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        """Close the pooled async HTTP client if no other block still uses it."""
+        self._async_users -= 1
+        if not self._async_users:
+            client, self._async_client = self._async_client, None
+            await client.aclose()
+    
+    def _new_async_client(self) -> httpx.AsyncClient:
+        """Create an async HTTP/2 client authenticated against Zyte API."""
+        # Concurrent requests are multiplexed over a few pooled connections
+        limits = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+        return httpx.AsyncClient(
+            auth=(self.api_key, ""),
+            timeout=60,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True, limits=limits, retries=self.max_retries
+            )
+        )
+    
+    def _build_payload(self, url: str, **kwargs) -> Dict[str, Any]:
+        """
+        Build a Zyte API request payload.
+        
+        Args:
+            url: URL to fetch
+            **kwargs: Additional parameters for the API request
+            
+        Returns:
+            Request payload, with browserHtml=True unless specified
+        """
+        return {
+            "url": url,
+            "browserHtml": kwargs.get("browserHtml", True),
+            **{k: v for k, v in kwargs.items() if k != "browserHtml"}
+        }
+    
+    @staticmethod
+    def get_header(result: Optional[Dict[str, Any]], name: str) -> Optional[str]:
+        """
+        Get a response header of the fetched page from a Zyte API result.
+        
+        Args:
+            result: Zyte API result requested with httpResponseHeaders=True
+            name: Header name (case-insensitive)
+            
+        Returns:
+            Header value or None if not present
+        """
+        for header in (result or {}).get("httpResponseHeaders") or []:
+            if header.get("name", "").lower() == name.lower():
+                return header.get("value")
+        return None
+    
+    @staticmethod
+    def _cache_key(payload: Dict[str, Any]) -> str:
+        """Build the cache key of a request payload."""
+        return json.dumps(payload, sort_keys=True)
+    
+    @staticmethod
+    def _conditional_payload(url: str, cached: Optional[CachedResponse]) -> Optional[Dict[str, Any]]:
+        """
+        Build a lightweight HTTP (non-browser) request revalidating a cached page.
+        
+        Browser requests can't carry conditional headers, so this is sent
+        before (not instead of) the browserHtml request: an unchanged page
+        costs one cheap HTTP request instead of a browser render, a changed
+        one costs both. Use cache_ttl to skip revalidating recent pages.
+        
+        Returns:
+            Request payload or None if the cached page has no validators
+        """
+        if not cached:
+            return None
+        headers = []
+        if cached.etag:
+            headers.append({"name": "If-None-Match", "value": cached.etag})
+        if cached.last_modified:
+            headers.append({"name": "If-Modified-Since", "value": cached.last_modified})
+        if not headers:
+            return None
+        return {
+            "url": url,
+            "httpResponseHeaders": True,
+            "customHttpRequestHeaders": headers,
+        }
+    
+    def _is_fresh(self, cached: Optional[CachedResponse]) -> bool:
+        """Whether a cached page is recent enough to be reused without revalidation."""
+        return (
+            cached is not None
+            and self.cache_ttl is not None
+            and time.time() - cached.fetched_at < self.cache_ttl
+        )
+    
+    def _store(self, key: str, result: Optional[Dict[str, Any]]):
+        """Cache a successful result together with the page's validators."""
+        if result:
+            self.cache.set(
+                key,
+                result,
+                etag=self.get_header(result, "ETag"),
+                last_modified=self.get_header(result, "Last-Modified")
+            )
+    
+    def _post(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Send a request to Zyte API and return the decoded result."""
+        if self.limiter:
+            self.limiter.wait()
+        
+        response = self._session.post(self.base_url, json=payload, timeout=60)
+        
+        if response.status_code == 200:
+            # orjson decodes the (large) browserHtml payload faster than json
+            return orjson.loads(response.content)
+        else:
+            logger.error(f"Zyte API error {response.status_code}: {response.text}")
+            return None
+    
+    async def _post_async(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Send a request to Zyte API without blocking the event loop."""
+        if self.limiter:
+            await self.limiter.acquire()
+        
+        if self._async_client is not None:
+            response = await self._async_client.post(self.base_url, json=payload)
+        else:
+            async with self._new_async_client() as client:
+                response = await client.post(self.base_url, json=payload)
+        
+        if response.status_code == 200:
+            return orjson.loads(response.content)
+        else:
+            logger.error(f"Zyte API error {response.status_code}: {response.text}")
+            return None
     
     def fetch_page(self, url: str, **kwargs) -> Optional[Dict[str, Any]]:
         """
@@ -35,44 +242,113 @@ class ZyteClient:
         
         try:
             # Zyte API request payload
-            # Default to browserHtml=True if not specified
-            payload = {
-                "url": url,
-                "browserHtml": kwargs.get("browserHtml", True),
-                **{k: v for k, v in kwargs.items() if k != "browserHtml"}
-            }
+            payload = self._build_payload(url, **kwargs)
+            if not self.cache:
+                return self._post(payload)
             
-            # Zyte API uses HTTP Basic Auth with API key as username and empty password
-            response = requests.post(
-                self.base_url,
-                auth=(self.api_key, ""),
-                json=payload,
-                timeout=60
-            )
+            key = self._cache_key(payload)
+            cached = self.cache.get(key)
+            if self._is_fresh(cached):
+                logger.info(f"Using cached response: {url}")
+                return cached.body
+            
+            conditional = self._conditional_payload(url, cached)
+            if conditional:
+                revalidation = self._post(conditional)
+                if revalidation and revalidation.get("statusCode") == 304:
+                    logger.info(f"Page not modified, using cached response: {url}")
+                    self.cache.touch(key)
+                    return cached.body
+            
+            result = self._post({**payload, "httpResponseHeaders": True})
+            self._store(key, result)
+            return result
+            
+        except Exception as e:
+            logger.error(f"Error fetching page {url} with Zyte API: {e}")
+            return None
+    
+    async def fetch_page_async(self, url: str, **kwargs) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a page using Zyte API without blocking the event loop.
+        
+        Uses the pooled client when called inside ``async with client:``,
+        otherwise a one-off client for this request.
+        
+        Args:
+            url: URL to fetch
+            **kwargs: Additional parameters for the API request (e.g., browserHtml=True)
+            
+        Returns:
+            Dictionary containing page data (browserHtml, etc.) or None if failed
+        """
+        logger.info(f"Fetching page with Zyte API: {url}")
+        
+        try:
+            payload = self._build_payload(url, **kwargs)
+            if not self.cache:
+                return await self._post_async(payload)
+            
+            key = self._cache_key(payload)
+            cached = self.cache.get(key)
+            if self._is_fresh(cached):
+                logger.info(f"Using cached response: {url}")
+                return cached.body
             
-            if response.status_code == 200:
-                result = response.json()
-                return result
-            else:
-                logger.error(f"Zyte API error {response.status_code}: {response.text}")
-                return None
+            conditional = self._conditional_payload(url, cached)
+            if conditional:
+                revalidation = await self._post_async(conditional)
+                if revalidation and revalidation.get("statusCode") == 304:
+                    logger.info(f"Page not modified, using cached response: {url}")
+                    self.cache.touch(key)
+                    return cached.body
+            
+            result = await self._post_async({**payload, "httpResponseHeaders": True})
+            self._store(key, result)
+            return result
             
         except Exception as e:
             logger.error(f"Error fetching page {url} with Zyte API: {e}")
             return None
     
-    def parse_html(self, html: str) -> Optional[BeautifulSoup]:
+    def parse_html(
+        self,
+        html: str,
+        strainer: Optional["SoupStrainer"] = None
+    ) -> Optional["BeautifulSoup"]:
         """
         Parse HTML content.
         
         Args:
             html: HTML content string
+            strainer: Only build the parts of the tree matching this strainer
+                (and their descendants); None parses the whole page
             
         Returns:
             BeautifulSoup object or None if failed
         """
+        from bs4 import BeautifulSoup
+        
+        try:
+            return BeautifulSoup(html, 'lxml', parse_only=strainer)
+        except Exception as e:
+            logger.error(f"Error parsing HTML: {e}")
+            return None
+    
+    def parse_html_lxml(self, html: str) -> Optional["HtmlElement"]:
+        """
+        Parse HTML content into an lxml tree, for XPath-based parsing.
+        
+        Args:
+            html: HTML content string
+            
+        Returns:
+            Root <html> element or None if failed
+        """
+        from lxml import html as lxml_html
+        
         try:
-            return BeautifulSoup(html, 'lxml')
+            return lxml_html.document_fromstring(html)
         except Exception as e:
             logger.error(f"Error parsing HTML: {e}")
             return None